@@ -0,0 +1,60 @@
+import os
+import re
+import gzip
+import json
+import time
+from typing import Optional
+
+
+class CheckpointStore:
+    """
+    Keeps partial list-collection state on disk so an interrupted crawl
+    can resume where it stopped instead of starting from the top.
+
+    Checkpoints older than ``max_age`` seconds are dropped on load: the
+    list has moved on since, and resuming would merge stale names into a
+    fresh crawl.
+    """
+
+    def __init__(self, directory="checkpoints", max_age: Optional[float] = 24 * 3600):
+        self.directory = directory
+        self.max_age = max_age
+
+    def _path(self, key: str) -> str:
+        safe_key = re.sub(r"[^A-Za-z0-9_.-]+", "_", key)
+        return os.path.join(self.directory, f"{safe_key}.json.gz")
+
+    def load(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            state = json.load(f)
+
+        age = time.time() - state.get("saved_at", 0)
+        if self.max_age is not None and age > self.max_age:
+            print(f"[!] Discarding checkpoint {key}, saved {age / 3600:.1f}h ago")
+            os.remove(path)
+            return None
+
+        print(f"[✔] Resuming {key} from checkpoint ({len(state.get('items', []))} items)")
+        return state
+
+    def save(self, key: str, state: dict) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        state = dict(state, saved_at=time.time())
+
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps(state))
+        os.replace(tmp_path, path)
+
+    def clear(self, key: str) -> None:
+        path = self._path(key)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+checkpoint_store = CheckpointStore()
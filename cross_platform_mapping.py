@@ -1,10 +1,26 @@
-from typing import List, Tuple, Dict
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
 from rapidfuzz import fuzz
 
 from models import social_model
+from mapping_results import (
+    ResultSet,
+    SimilarPair,
+    PlatformComparison,
+    IdentityGroup,
+    Influencer,
+    NetworkStats,
+    InfluenceResult,
+)
 
 
 class CrossPlatformMapper:
+    """
+    Collects cards from every scraper and matches users across platforms.
+
+    The analyses return structured, lazily evaluated results. Text output
+    lives in mapping_report and is only produced when a caller asks for it.
+    """
 
     _instance = None
     _cards: List[social_model] = []
@@ -19,138 +35,161 @@ class CrossPlatformMapper:
         self._cards.append(card)
         print(f"[CrossPlatformMapper] Card added from platform: {card.m_platform}")
 
+    def add_cards(self, rows: Iterable[dict], validate: bool = False) -> List[social_model]:
+        """
+        Bulk ingestion of card dicts through social_model.bulk, without the
+        per-card log line.
+        """
+        cards = social_model.bulk(rows, validate=validate)
+        self._cards.extend(cards)
+        print(f"[CrossPlatformMapper] {len(cards)} cards added")
+        return cards
+
+    def rank_cards(self, metric: str = "m_total_followers_n",
+                   minimum: Optional[int] = None) -> ResultSet[social_model]:
+        """
+        Cards ordered by a parsed count field, largest first. Cards without
+        the count, or below ``minimum``, are left out.
+        """
+        def ranked():
+            cards = [
+                card for card in self._cards
+                if getattr(card, metric) is not None
+                and (minimum is None or getattr(card, metric) >= minimum)
+            ]
+            cards.sort(key=lambda card: getattr(card, metric), reverse=True)
+            return cards
+
+        return ResultSet(ranked, cache=True)
+
     def get_all_cards(self) -> List[social_model]:
         return self._cards
 
-    def print_all_cards(self) -> None:
-        print("CROSS-PLATFORM MAPPING - ALL COLLECTED CARDS")
-
-        if not self._cards:
-            print("No cards collected.")
-            return
+    def iter_cards(self) -> ResultSet[social_model]:
+        return ResultSet(lambda: self._cards)
 
-        for i, card in enumerate(self._cards, 1):
-            print(f"\n--- Card {i} ---")
-            print(f"Platform: {card.m_platform}")
-            print(f"Network: {card.m_network}")
-            print(f"Web Links: {card.m_weblink}")
-            print(f"Content Type: {card.m_content_type}")
-            print(f"Content: {card.m_content}")
+    def print_all_cards(self) -> None:
+        from mapping_report import render_cards
 
-            if card.m_followers:
-                print(f"Followers ({len(card.m_followers)}): {card.m_followers}")
-            if card.m_following:
-                print(f"Following ({len(card.m_following)}): {card.m_following}")
-            if card.m_mutual_usernames:
-                print(f"Mutual Connections ({len(card.m_mutual_usernames)}): {card.m_mutual_usernames}")
-            if card.m_commenters:
-                print(f"Commenters ({len(card.m_commenters)}): {card.m_commenters}")
-            if card.m_post_likes:
-                print(f"Post Likes: {card.m_post_likes}")
-            if card.m_post_comments:
-                print(f"Post Comments: {card.m_post_comments}")
-            if card.m_post_views:
-                print(f"Post Views: {card.m_post_views}")
-            if card.m_views:
-                print(f"Views: {card.m_views}")
-
-        print(f"\nTotal cards collected: {len(self._cards)}")
+        render_cards(self.iter_cards())
 
     def clear_cards(self) -> None:
         self._cards = []
         print("[CrossPlatformMapper] All cards cleared.")
 
-    def compare_following_across_platforms(self, threshold: int = 70) -> None:
-        print("CROSS-PLATFORM FOLLOWING COMPARISON (PAIRWISE)")
-
+    def resolve_identities(self, store) -> Dict[Tuple[str, str], int]:
+        """
+        Resolves every username on the collected cards against a persistent
+        IdentityStore, writing new identities and aliases back to it.
+        Returns {(platform, username): identity_id}.
+        """
+        resolved: Dict[Tuple[str, str], int] = {}
+        for card in self._cards:
+            resolved.update(store.resolve_card(card))
+        return resolved
+
+    def compare_following_across_platforms(self, threshold: int = 70,
+                                           matcher: str = "exhaustive") -> ResultSet[PlatformComparison]:
+        """
+        matcher="lsh" finds similar pairs through an IdentityIndex instead
+        of comparing every username pair.
+        """
         platform_following = {
             card.m_platform: list(set(card.m_following))
             for card in self._cards
             if card.m_following
         }
-
-        if len(platform_following) < 2:
-            print("Not enough platforms with following data.")
-            return
-
         platforms = list(platform_following.keys())
 
-        for i in range(len(platforms)):
-            for j in range(i + 1, len(platforms)):
-                p1, p2 = platforms[i], platforms[j]
-                list1 = platform_following[p1]
-                list2 = platform_following[p2]
+        def similar_pairs(list1, list2):
+            if matcher == "lsh":
+                from identity_index import IdentityIndex
 
-                print(f"\n>>> {p1}  VS  {p2}")
+                # The exhaustive comparison below ignores case, so this one does too.
+                index = IdentityIndex(ignore_case=True)
+                index.add_many(list2)
+                for u1 in list1:
+                    for entry_id, score in index.match(u1, threshold):
+                        u2 = index.entries[entry_id][1]
+                        if u1 != u2:
+                            yield SimilarPair(u1, u2, score)
+                return
+
+            for u1 in list1:
+                for u2 in list2:
+                    if u1 == u2:
+                        continue
+                    score = fuzz.ratio(u1.lower(), u2.lower())
+                    if score >= threshold:
+                        yield SimilarPair(u1, u2, score)
+
+        def comparisons():
+            for i in range(len(platforms)):
+                for j in range(i + 1, len(platforms)):
+                    p1, p2 = platforms[i], platforms[j]
+                    list1 = platform_following[p1]
+                    list2 = platform_following[p2]
+                    set1, set2 = set(list1), set(list2)
+
+                    yield PlatformComparison(
+                        platform_a=p1,
+                        platform_b=p2,
+                        exact=ResultSet(lambda s1=set1, s2=set2: sorted(s1 & s2)),
+                        similar=ResultSet(lambda l1=list1, l2=list2: similar_pairs(l1, l2)),
+                        only_a=ResultSet(lambda s1=set1, s2=set2: sorted(s1 - s2)),
+                        only_b=ResultSet(lambda s1=set1, s2=set2: sorted(s2 - s1)),
+                    )
+
+        return ResultSet(comparisons)
+
+    def group_following_across_all_platforms(self, threshold: int = 70,
+                                             matcher: str = "exhaustive") -> ResultSet[IdentityGroup]:
+        """
+        matcher="lsh" clusters usernames through an IdentityIndex. Groups
+        are then the connected components of the verified matches, rather
+        than the first group each username happens to match.
+        """
+        def groups():
+            users: List[Tuple[str, str]] = []
+            for card in self._cards:
+                if card.m_following:
+                    for username in card.m_following:
+                        users.append((card.m_platform, username))
+
+            if matcher == "lsh":
+                from identity_index import IdentityIndex
+
+                index = IdentityIndex()
+                for platform, username in users:
+                    index.add(username, platform)
+                return [IdentityGroup(g) for g in index.groups(threshold)]
+
+            grouped: List[List[Tuple[str, str]]] = []
+
+            for platform, username in users:
+                matched = False
+                for group in grouped:
+                    if any(fuzz.ratio(username, existing_username) >= threshold
+                           for _, existing_username in group):
+                        group.append((platform, username))
+                        matched = True
+                        break
+                if not matched:
+                    grouped.append([(platform, username)])
 
-                exact = sorted(set(list1) & set(list2))
-                print(f"Exact Matches ({len(exact)}): {exact}")
+            return [IdentityGroup(g) for g in grouped if len(g) > 1]
 
-                similar: List[Tuple[str, str, float]] = []
-                for u1 in list1:
-                    for u2 in list2:
-                        if u1 == u2:
-                            continue
-                        score = fuzz.ratio(u1.lower(), u2.lower())
-                        if score >= threshold:
-                            similar.append((u1, u2, score))
-
-                print(
-                    f"Similar Matches ({len(similar)}): "
-                    f"{[(u1, u2, f'{s}%') for u1, u2, s in similar]}"
-                )
-
-                only_p1 = sorted(set(list1) - set(list2))
-                only_p2 = sorted(set(list2) - set(list1))
-                print(f"Only on {p1}: {only_p1}")
-                print(f"Only on {p2}: {only_p2}")
-
-    def group_following_across_all_platforms(self, threshold: int = 70) -> None:
-        print("GLOBAL USERNAME IDENTITY GROUPING")
-
-        users: List[Tuple[str, str]] = []
-        for card in self._cards:
-            if card.m_following:
-                for username in card.m_following:
-                    users.append((card.m_platform, username))
-
-        if not users:
-            print("No following data available.")
-            print("=" * 60)
-            return
-
-        groups: List[List[Tuple[str, str]]] = []
-
-        for platform, username in users:
-            matched = False
-            for group in groups:
-                if any(fuzz.ratio(username, existing_username) >= threshold
-                       for _, existing_username in group):
-                    group.append((platform, username))
-                    matched = True
-                    break
-            if not matched:
-                groups.append([(platform, username)])
-
-        meaningful_groups = [g for g in groups if len(g) > 1]
-        if not meaningful_groups:
-            print("No cross-platform identities found above threshold.")
-        else:
-            for idx, group in enumerate(meaningful_groups, 1):
-                print(f"\nIdentity Group {idx}:")
-                for platform, username in sorted(group):
-                    scores = [
-                        fuzz.ratio(username, other)
-                        for _, other in group
-                        if other != username
-                    ]
-                    confidence = max(scores) if scores else 100
-                    print(f"  {platform}: {username} ({confidence}%)")
-
-        print("\n" + "=" * 60)
-
-    def analyze_cross_platform_influence(self, threshold: int = 70) -> None:
-        print("CROSS-PLATFORM INFLUENCE & NETWORK INTELLIGENCE")
+        return ResultSet(groups, cache=True)
+
+    def analyze_cross_platform_influence(self, threshold: int = 70, scoring: str = "fuzzy") -> InfluenceResult:
+        """
+        scoring="fuzzy" merges usernames by fuzzy match and ranks them with
+        the hand-tuned formula. "legacy", "degree" and "pagerank" use the
+        sparse InfluenceGraph, which merges on normalized usernames and
+        scales to millions of edges.
+        """
+        if scoring != "fuzzy":
+            return self._analyze_influence_graph(scoring)
 
         user_profiles: Dict[str, Dict] = {}
 
@@ -205,11 +244,6 @@ class CrossPlatformMapper:
 
                 profile.setdefault('platform_details', {}).setdefault(plat, []).append(conn_type)
 
-        if not user_profiles:
-            print("No user data available for analysis.")
-            print("=" * 60)
-            return
-
         scored_users = []
 
         for username, profile in user_profiles.items():
@@ -228,65 +262,81 @@ class CrossPlatformMapper:
                 network_score
             )
 
-            scored_users.append({
-                'username': username,
-                'profile': profile,
-                'score': influence_score
-            })
-
-        scored_users.sort(key=lambda x: x['score'], reverse=True)
-
-        print("\n>>> TOP CROSS-PLATFORM INFLUENCERS")
-        print("-" * 60)
-
-        for i, user_data in enumerate(scored_users[:10], 1):
-            profile = user_data['profile']
-            print(f"\n{i}. Username Variations: {sorted(profile['original_names'])}")
-            print(f"   Influence Score: {user_data['score']:.1f}")
-            print(f"   Platforms: {sorted(profile['platforms'])}")
-            print(f"   Connection Types: {sorted(profile['connection_types'])}")
-            print(f"   Network Stats: {profile['follower_count']} followers, "
-                  f"{profile['following_count']} following, "
-                  f"{profile['mutual_count']} mutual")
-
-            print("   Platform Breakdown:")
-            for plat, types in sorted(profile['platform_details'].items()):
-                print(f"      {plat}: {', '.join(sorted(set(types)))}")
-
-        print("\n\n>>> CROSS-PLATFORM BRIDGE USERS (Multi-Platform Connectors)")
-        print("-" * 60)
-
-        bridge_users = [u for u in scored_users if len(u['profile']['platforms']) >= 2]
-
-        for user_data in bridge_users[:15]:
-            profile = user_data['profile']
-            platforms_str = " ↔ ".join(sorted(profile['platforms']))
-            names_str = " / ".join(sorted(profile['original_names']))
-            print(f"  • {names_str}")
-            print(f"    Bridges: {platforms_str}")
-            print(f"    Connection Types: {', '.join(sorted(profile['connection_types']))}")
-
-        print("\n\n>>> NETWORK STATISTICS")
-        print("-" * 60)
+            scored_users.append(Influencer(
+                names=sorted(profile['original_names']),
+                score=influence_score,
+                platforms=sorted(profile['platforms']),
+                connection_types=sorted(profile['connection_types']),
+                follower_count=profile['follower_count'],
+                following_count=profile['following_count'],
+                mutual_count=profile['mutual_count'],
+                platform_breakdown={
+                    plat: sorted(set(types))
+                    for plat, types in sorted(profile['platform_details'].items())
+                },
+            ))
+
+        def ranker(k: int, bridges_only: bool) -> List[Influencer]:
+            return heapq.nlargest(
+                k,
+                (u for u in scored_users if not bridges_only or len(u.platforms) >= 2),
+                key=lambda u: u.score
+            )
 
         total_users = len(user_profiles)
-        multi_platform = len([u for u in user_profiles.values() if len(u['platforms']) > 1])
-        avg_platforms = sum(len(u['platforms']) for u in user_profiles.values()) / total_users
-
-        print(f"Total Unique Users: {total_users}")
-        print(f"Multi-Platform Users: {multi_platform} ({multi_platform/total_users*100:.1f}%)")
-        print(f"Average Platforms per User: {avg_platforms:.2f}")
-
-        conn_type_dist = {}
+        conn_type_dist: Dict[str, int] = {}
         for profile in user_profiles.values():
             for conn_type in profile['connection_types']:
                 conn_type_dist[conn_type] = conn_type_dist.get(conn_type, 0) + 1
 
-        print("\nConnection Type Distribution:")
-        for conn_type, count in sorted(conn_type_dist.items(), key=lambda x: x[1], reverse=True):
-            print(f"  {conn_type}: {count} users")
+        stats = NetworkStats(
+            total_users=total_users,
+            multi_platform_users=len([u for u in user_profiles.values() if len(u['platforms']) > 1]),
+            average_platforms=(
+                sum(len(u['platforms']) for u in user_profiles.values()) / total_users
+                if total_users else 0.0
+            ),
+            connection_type_distribution=conn_type_dist,
+        )
+
+        return InfluenceResult(scoring=scoring, stats=stats, ranker=ranker)
+
+    def _analyze_influence_graph(self, scoring: str) -> InfluenceResult:
+        from influence_graph import InfluenceGraph, RELATIONS
+
+        graph = InfluenceGraph.from_cards(self._cards)
+        scores = graph.scores(scoring)
+        counts = graph.relation_counts()
+        diversity = graph.platform_diversity()
+        listed = graph.listed()
+
+        def entry(index) -> Influencer:
+            return Influencer(
+                names=[graph.names[index]],
+                score=float(scores[index]),
+                platforms=graph.node_platforms(index),
+                connection_types=[r for r, c in zip(RELATIONS, counts[index]) if c],
+                follower_count=int(counts[index, 0]),
+                following_count=int(counts[index, 1]),
+                mutual_count=int(counts[index, 2]),
+            )
 
-        print("\n" + "=" * 60)
+        def ranker(k: int, bridges_only: bool) -> List[Influencer]:
+            mask = listed & (diversity >= 2) if bridges_only else listed
+            return [entry(index) for index in graph.top_k(scores, k, mask=mask)]
+
+        total_users = int(listed.sum())
+        stats = NetworkStats(
+            total_users=total_users,
+            total_edges=graph.num_edges,
+            multi_platform_users=int((diversity[listed] > 1).sum()),
+            average_platforms=float(diversity[listed].mean()) if total_users else 0.0,
+            connection_type_distribution={
+                relation: int(n) for relation, n in zip(RELATIONS, (counts > 0).sum(axis=0)) if n
+            },
+        )
+
+        return InfluenceResult(scoring=scoring, stats=stats, ranker=ranker)
 
 
 cross_platform_mapper = CrossPlatformMapper()
@@ -0,0 +1,58 @@
+import math
+import time
+from typing import List, Optional, Tuple
+
+
+class Deadline:
+    """
+    Per-job time budget. budget=None means no limit.
+    """
+
+    def __init__(self, budget: Optional[float] = None):
+        self.budget = budget
+        self.started = time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def remaining(self) -> float:
+        if self.budget is None:
+            return math.inf
+        return max(self.budget - self.elapsed(), 0.0)
+
+    def expired(self, slack: float = 0.0) -> bool:
+        return self.remaining() <= slack
+
+    def timeout_ms(self, default_ms: float) -> float:
+        """
+        Caps a Playwright timeout so a single call cannot run past the
+        budget.
+        """
+        return max(min(default_ms, self.remaining() * 1000), 1)
+
+
+class LatencyTracker:
+    """
+    Collects per-job wall times for runner-level percentile reporting.
+    """
+
+    def __init__(self):
+        self.samples: List[Tuple[str, float, bool]] = []
+
+    def record(self, name: str, seconds: float, partial: bool = False) -> None:
+        self.samples.append((name, seconds, partial))
+
+    def percentile(self, p: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(seconds for _, seconds, _ in self.samples)
+        rank = max(math.ceil(p / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+    def summary(self) -> str:
+        partial = sum(1 for _, _, is_partial in self.samples if is_partial)
+        return (
+            f"{len(self.samples)} jobs, {partial} partial | "
+            f"p50 {self.percentile(50):.1f}s | p99 {self.percentile(99):.1f}s | "
+            f"max {self.percentile(100):.1f}s"
+        )
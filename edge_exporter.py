@@ -0,0 +1,150 @@
+from typing import Iterable, Iterator, Tuple
+
+from models import social_model
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+
+RELATION_FIELDS = (
+    ("m_followers", "follower"),
+    ("m_following", "following"),
+    ("m_mutual_usernames", "mutual"),
+)
+
+COLUMNS = ("platform", "source", "target", "relation", "crawled_at")
+
+
+def card_source(card: social_model) -> str:
+    if card.m_username:
+        return card.m_username
+    return card.m_weblink[0] if card.m_weblink else ""
+
+
+def card_edges(card: social_model) -> Iterator[Tuple]:
+    """
+    Yields one (platform, source, target, relation, crawled_at) row per
+    connection listed on the card.
+    """
+    source = card_source(card)
+    for field, relation in RELATION_FIELDS:
+        for target in getattr(card, field) or []:
+            yield card.m_platform, source, target, relation, card.m_crawled_at
+
+
+def edge_schema():
+    text = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("platform", text),
+        ("source", text),
+        ("target", text),
+        ("relation", text),
+        ("crawled_at", pa.timestamp("us", tz="UTC")),
+    ])
+
+
+class EdgeExporter:
+    """
+    Streams cards into a normalized edge table.
+
+    Rows are buffered per column and written in batches, so memory stays
+    bounded by batch_size no matter how many edges are exported. String
+    columns are dictionary-encoded. Use format="parquet" for analytics or
+    format="arrow" for an Arrow IPC stream.
+    """
+
+    def __init__(self, path: str, format: str = "parquet", batch_size: int = 65536):
+        if pa is None:
+            raise ImportError("EdgeExporter requires pyarrow: pip install pyarrow")
+        if format not in ("parquet", "arrow"):
+            raise ValueError(f"Unsupported edge export format: {format}")
+
+        self.path = path
+        self.format = format
+        self.batch_size = batch_size
+        self.schema = edge_schema()
+        self.rows_written = 0
+
+        self._buffer = {column: [] for column in COLUMNS}
+        self._sink = None
+        self._writer = None
+
+    def _open(self):
+        if self.format == "parquet":
+            self._writer = pq.ParquetWriter(
+                self.path, self.schema, compression="zstd", use_dictionary=True
+            )
+        else:
+            self._sink = pa.OSFile(self.path, "wb")
+            self._writer = pa_ipc.new_stream(self._sink, self.schema)
+
+    def write_rows(self, rows: Iterable[Tuple]) -> None:
+        # flush() empties these lists in place, so the reference stays valid.
+        buffer = self._buffer
+        for row in rows:
+            for column, value in zip(COLUMNS, row):
+                buffer[column].append(value)
+            if len(buffer["target"]) >= self.batch_size:
+                self.flush()
+
+    def write_card(self, card: social_model) -> None:
+        self.write_rows(card_edges(card))
+
+    def write_cards(self, cards: Iterable[social_model]) -> None:
+        for card in cards:
+            self.write_card(card)
+
+    def write_batch(self, batch) -> None:
+        """
+        Sink interface for pipeline.run_stream: writes a ConnectionBatch
+        as soon as the scraper yields it.
+        """
+        self.write_rows(batch.edges())
+
+    def close_stream(self, card=None) -> None:
+        self.flush()
+
+    def flush(self) -> None:
+        count = len(self._buffer["target"])
+        if not count:
+            return
+
+        if self._writer is None:
+            self._open()
+
+        batch = pa.record_batch(
+            [pa.array(self._buffer[field.name], type=field.type) for field in self.schema],
+            schema=self.schema,
+        )
+        self._writer.write_batch(batch)
+
+        self.rows_written += count
+        for values in self._buffer.values():
+            values.clear()
+
+    def close(self) -> None:
+        self.flush()
+        if self._writer is None:
+            # Still produce a valid, empty file.
+            self._open()
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+        print(f"[EdgeExporter] Wrote {self.rows_written} edges to {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def export_edges(cards: Iterable[social_model], path: str, format: str = "parquet",
+                 batch_size: int = 65536) -> int:
+    with EdgeExporter(path, format=format, batch_size=batch_size) as exporter:
+        exporter.write_cards(cards)
+    return exporter.rows_written
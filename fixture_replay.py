@@ -0,0 +1,169 @@
+import os
+import re
+import json
+import base64
+import hashlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from playwright.sync_api import Browser, BrowserContext, Error, Page, Route, Request
+
+
+HAR_NAME = "traffic.har"
+SNAPSHOT_DIR = "snapshots"
+
+SECRET_HEADERS = {
+    "cookie", "set-cookie", "authorization", "proxy-authorization",
+    "x-csrftoken", "x-ig-www-claim", "x-fb-lsd", "x-asbd-id",
+}
+
+
+def body_hash(body) -> Optional[str]:
+    if not body:
+        return None
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return hashlib.sha1(body).hexdigest()
+
+
+class FixtureRecorder:
+    """
+    Records a crawl for offline replay: all network traffic goes to a HAR
+    file with embedded bodies, and every collector round stores an HTML
+    snapshot of each open page.
+
+    Call scrub() after the context is closed (that is when Playwright
+    writes the HAR) to drop cookies and auth headers from the capture.
+    Request and response bodies are kept as recorded, so review them
+    before sharing captures from logged-in sessions.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._round = 0
+        os.makedirs(os.path.join(directory, SNAPSHOT_DIR), exist_ok=True)
+
+    @property
+    def har_path(self) -> str:
+        return os.path.join(self.directory, HAR_NAME)
+
+    def new_context(self, browser: Browser) -> BrowserContext:
+        return browser.new_context(record_har_path=self.har_path, record_har_content="embed")
+
+    def scrub(self) -> None:
+        if not os.path.exists(self.har_path):
+            return
+
+        with open(self.har_path, encoding="utf-8") as f:
+            har = json.load(f)
+
+        for entry in har["log"]["entries"]:
+            for message in (entry["request"], entry["response"]):
+                message["cookies"] = []
+                message["headers"] = [
+                    h for h in message.get("headers", [])
+                    if h["name"].lower() not in SECRET_HEADERS
+                ]
+
+        tmp_path = f"{self.har_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(har, f)
+        os.replace(tmp_path, self.har_path)
+
+    def attach(self, scraper) -> None:
+        scraper.round_hook = lambda page: self.snapshot(page, scraper.name)
+
+    def snapshot(self, page: Page, label: str) -> None:
+        self._round += 1
+        for index, open_page in enumerate(page.context.pages):
+            name = f"{label}_{self._round:04d}_{index}.html"
+            path = os.path.join(self.directory, SNAPSHOT_DIR, re.sub(r"[^A-Za-z0-9_.-]+", "_", name))
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"<!-- {open_page.url} -->\n")
+                f.write(open_page.content())
+
+
+class FixtureReplayer:
+    """
+    Serves a recorded HAR through a context-wide page.route handler, so
+    collectors run against the captures with no network access.
+
+    Responses are keyed by method, URL and a hash of the request body, so
+    GraphQL POSTs to one endpoint get the answer to their own query. For a
+    key they are replayed in the order they were recorded, and the last
+    one repeats once they run out. A body that was never recorded falls
+    back to the responses for the same method and URL.
+
+    Every fulfilled request waits latency_ms first to model a fixed,
+    reproducible network delay. The wait goes through the page, so
+    concurrent requests wait in parallel rather than one after another.
+    Unrecorded requests get a 404.
+    """
+
+    def __init__(self, directory: str, latency_ms: int = 0):
+        self.directory = directory
+        self.latency_ms = latency_ms
+        self.served = 0
+        self.missed = 0
+        self._responses: Dict[Tuple, List[dict]] = defaultdict(list)
+        self._cursor: Dict[Tuple, int] = defaultdict(int)
+
+        with open(os.path.join(directory, HAR_NAME), encoding="utf-8") as f:
+            har = json.load(f)
+
+        for entry in har["log"]["entries"]:
+            request = entry["request"]
+            digest = body_hash(request.get("postData", {}).get("text"))
+            self._responses[(request["method"], request["url"], digest)].append(entry["response"])
+            self._responses[(request["method"], request["url"])].append(entry["response"])
+
+    def install(self, context: BrowserContext) -> None:
+        context.route("**/*", self._handle)
+
+    def _handle(self, route: Route, request: Request) -> None:
+        key = (request.method, request.url, body_hash(request.post_data_buffer))
+        recorded = self._responses.get(key)
+        if not recorded:
+            key = (request.method, request.url)
+            recorded = self._responses.get(key)
+        if not recorded:
+            self.missed += 1
+            route.fulfill(status=404, body="")
+            return
+
+        position = min(self._cursor[key], len(recorded) - 1)
+        self._cursor[key] += 1
+        response = recorded[position]
+
+        content = response.get("content", {})
+        body = content.get("text", "")
+        if content.get("encoding") == "base64":
+            body = base64.b64decode(body)
+
+        headers = {
+            h["name"]: h["value"]
+            for h in response.get("headers", [])
+            if h["name"].lower() not in ("content-length", "content-encoding", "transfer-encoding")
+        }
+
+        if self.latency_ms:
+            self._wait(request)
+
+        status = response.get("status") or 0
+        if status <= 0:
+            route.abort()
+            return
+
+        self.served += 1
+        route.fulfill(status=status, headers=headers, body=body)
+
+    def _wait(self, request: Request) -> None:
+        # Route handlers run in their own greenlet, so a Playwright wait
+        # hands control back to the dispatcher while this request waits.
+        # time.sleep would block every other request and page event.
+        try:
+            page = request.frame.page
+        except Error:
+            # Service worker requests have no frame to wait on.
+            return
+        page.wait_for_timeout(self.latency_ms)
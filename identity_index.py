@@ -0,0 +1,210 @@
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from rapidfuzz import fuzz, process
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+_PRIME = (1 << 31) - 1
+
+
+def shingles(username: str, k: int = 2) -> Set[str]:
+    """
+    Character k-grams of the normalized username, padded so that short
+    names and the first/last characters still produce shingles.
+    """
+    text = f"^{username.lower().strip()}$"
+    if len(text) <= k:
+        return {text}
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+def deletion_keys(username: str) -> Set[str]:
+    """
+    The username and every variant with one character removed. Two names
+    within one substitution, insertion, deletion or transposition always
+    share a key.
+    """
+    text = username.lower().strip()
+    return {text} | {text[:i] + text[i + 1:] for i in range(len(text))}
+
+
+class IdentityIndex:
+    """
+    Approximate username index based on MinHash signatures and
+    locality-sensitive hashing.
+
+    Each username is reduced to a MinHash signature over its character
+    shingles. The signature is cut into bands, and usernames sharing any
+    band land in the same bucket. Only usernames that share a bucket are
+    compared with fuzz.ratio, so matching is near-linear in the number of
+    usernames instead of quadratic.
+
+    With the defaults (128 permutations, 32 bands of 4 rows) pairs with a
+    bigram Jaccard similarity above roughly 0.4 become candidates. Short
+    names have too few bigrams for that: one edit in a 4-character name
+    changes half of them. So names up to ``edit_length`` characters are
+    also bucketed by their one-deletion variants, which makes every
+    single-edit pair among them a candidate. Pairs that are two or more
+    edits apart are left to the bands, and recall on those drops as names
+    get shorter. Use evaluate() to check recall and precision on real data.
+
+    Matches are verified with fuzz.ratio on the names as given, like the
+    exhaustive matchers; ignore_case=True compares lowercased names.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, shingle_size: int = 2, seed: int = 1,
+                 edit_length: int = 12, ignore_case: bool = False):
+        if np is None:
+            raise ImportError("IdentityIndex requires numpy: pip install numpy")
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.edit_length = edit_length
+        self.ignore_case = ignore_case
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+
+        self.entries: List[Tuple[str, str]] = []
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def signature(self, username: str):
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles(username, self.shingle_size)),
+            dtype=np.uint64,
+        )
+        # a < 2^31 and hash < 2^32, so the product fits in uint64.
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, username: str) -> Iterator[Tuple[int, bytes]]:
+        signature = self.signature(username)
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, signature[start:start + self.rows].tobytes()
+
+        # Band -1 holds the one-deletion keys. Names one character longer
+        # than edit_length are included so insertions are still found.
+        if len(username.strip()) <= self.edit_length + 1:
+            for key in deletion_keys(username):
+                yield -1, key.encode("utf-8")
+
+    def _text(self, username: str) -> str:
+        return username.lower() if self.ignore_case else username
+
+    def add(self, username: str, platform: str = "") -> int:
+        entry_id = len(self.entries)
+        self.entries.append((platform, username))
+        for key in self._band_keys(username):
+            self._buckets[key].append(entry_id)
+        return entry_id
+
+    def add_many(self, usernames: Iterable[str], platform: str = "") -> None:
+        for username in usernames:
+            self.add(username, platform)
+
+    def query(self, username: str) -> Set[int]:
+        """
+        Ids of indexed usernames that share at least one band with
+        ``username``. The username itself does not need to be indexed.
+        """
+        found: Set[int] = set()
+        for key in self._band_keys(username):
+            found.update(self._buckets.get(key, ()))
+        return found
+
+    def candidate_pairs(self) -> Set[Tuple[int, int]]:
+        pairs: Set[Tuple[int, int]] = set()
+        for members in self._buckets.values():
+            if len(members) < 2:
+                continue
+            for i, left in enumerate(members):
+                for right in members[i + 1:]:
+                    pairs.add((left, right))
+        return pairs
+
+    def _score(self, left: int, right: int) -> float:
+        return fuzz.ratio(self._text(self.entries[left][1]), self._text(self.entries[right][1]))
+
+    def matches(self, threshold: int = 70, cross_platform_only: bool = False) -> Iterator[Tuple[int, int, float]]:
+        """
+        Candidate pairs verified with the same rapidfuzz score as the
+        exhaustive matcher.
+        """
+        for left, right in self.candidate_pairs():
+            if cross_platform_only and self.entries[left][0] == self.entries[right][0]:
+                continue
+            score = self._score(left, right)
+            if score >= threshold:
+                yield left, right, score
+
+    def match(self, username: str, threshold: int = 70) -> List[Tuple[int, float]]:
+        text = self._text(username)
+        scored = ((i, fuzz.ratio(text, self._text(self.entries[i][1]))) for i in self.query(username))
+        return sorted(((i, s) for i, s in scored if s >= threshold), key=lambda x: -x[1])
+
+    def groups(self, threshold: int = 70) -> List[List[Tuple[str, str]]]:
+        """
+        Connected components of the verified match graph.
+        """
+        parent = list(range(len(self.entries)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for left, right, _ in self.matches(threshold):
+            root_left, root_right = find(left), find(right)
+            if root_left != root_right:
+                parent[root_right] = root_left
+
+        components: Dict[int, List[Tuple[str, str]]] = defaultdict(list)
+        for entry_id, entry in enumerate(self.entries):
+            components[find(entry_id)].append(entry)
+        return [members for members in components.values() if len(members) > 1]
+
+    def evaluate(self, threshold: int = 70, sample: Optional[int] = None) -> Dict[str, float]:
+        """
+        Compares the index against exhaustive fuzz.ratio matching over the
+        first ``sample`` entries (all of them by default).
+
+        recall: share of exhaustive matches the index found.
+        candidate_precision: share of LSH candidates that were real matches.
+        """
+        n = len(self.entries) if sample is None else min(sample, len(self.entries))
+        names = [self._text(username) for _, username in self.entries[:n]]
+
+        truth: Set[Tuple[int, int]] = set()
+        if names:
+            scores = process.cdist(names, names, scorer=fuzz.ratio, score_cutoff=threshold, workers=-1)
+            rows, cols = np.nonzero(scores)
+            truth = {(int(r), int(c)) for r, c in zip(rows, cols) if r < c}
+
+        candidates = {(l, r) for l, r in self.candidate_pairs() if l < n and r < n}
+        found = {(l, r) for l, r in candidates if self._score(l, r) >= threshold}
+
+        return {
+            "entries": n,
+            "exhaustive_matches": len(truth),
+            "candidates": len(candidates),
+            "verified_matches": len(found),
+            "recall": len(found & truth) / len(truth) if truth else 1.0,
+            "candidate_precision": len(found) / len(candidates) if candidates else 1.0,
+            "comparisons_saved": 1.0 - len(candidates) / max(n * (n - 1) // 2, 1),
+        }
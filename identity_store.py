@@ -0,0 +1,233 @@
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from rapidfuzz import fuzz
+
+from models import social_model
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS identities (
+    id INTEGER PRIMARY KEY,
+    canonical TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS aliases (
+    id INTEGER PRIMARY KEY,
+    identity_id INTEGER NOT NULL REFERENCES identities(id),
+    platform TEXT NOT NULL,
+    username TEXT NOT NULL,
+    norm TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    UNIQUE (platform, norm)
+);
+CREATE INDEX IF NOT EXISTS aliases_norm ON aliases(norm);
+CREATE INDEX IF NOT EXISTS aliases_identity ON aliases(identity_id);
+CREATE TABLE IF NOT EXISTS trigrams (
+    gram TEXT NOT NULL,
+    alias_id INTEGER NOT NULL,
+    PRIMARY KEY (gram, alias_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS gram_counts (
+    gram TEXT PRIMARY KEY,
+    n INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def normalize(username: str) -> str:
+    return username.lower().strip()
+
+
+def trigrams(norm: str) -> List[str]:
+    text = f"  {norm} "
+    return sorted({text[i:i + 3] for i in range(len(text) - 2)})
+
+
+class IdentityStore:
+    """
+    Persistent username index in SQLite.
+
+    Every canonical identity keeps its platform aliases. A trigram table
+    lets new usernames be matched against the whole history through
+    indexed lookups, and candidates are verified with fuzz.ratio like the
+    in-memory matchers. Only the pages a query touches are read from disk.
+
+    Grams shared by more than ``max_posting`` aliases (for example the
+    leading "  j") are skipped, so a lookup reads a bounded number of
+    postings however long the history grows. A candidate must share at
+    least a third of the remaining grams. An identity never gets two
+    aliases on the same platform: two similar names there are two accounts.
+    """
+
+    def __init__(self, path: str = "identities.sqlite", threshold: int = 70, max_candidates: int = 50,
+                 max_posting: int = 5000):
+        self.path = path
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        self.max_posting = max_posting
+
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _alias(self, platform: str, norm: str) -> Optional[Tuple[int, int]]:
+        return self.conn.execute(
+            "SELECT id, identity_id FROM aliases WHERE platform = ? AND norm = ?",
+            (platform, norm),
+        ).fetchone()
+
+    def _selective_grams(self, grams: List[str]) -> List[str]:
+        counts = dict(self.conn.execute(
+            f"SELECT gram, n FROM gram_counts WHERE gram IN ({','.join('?' * len(grams))})",
+            grams,
+        ).fetchall())
+        known = [gram for gram in grams if gram in counts]
+        selective = [gram for gram in known if counts[gram] <= self.max_posting]
+        if not selective and known:
+            # Only common grams: fall back to the rarest one.
+            selective = [min(known, key=counts.get)]
+        return selective
+
+    def candidates(self, username: str, platform: Optional[str] = None) -> List[Tuple[int, str, float]]:
+        """
+        Identities whose aliases look like ``username``, best first, as
+        (identity_id, alias username, score). With ``platform``, identities
+        that already have an alias there are left out. Read-only.
+        """
+        norm = normalize(username)
+        other_platform = (
+            "AND NOT EXISTS (SELECT 1 FROM aliases AS b WHERE b.identity_id = a.identity_id AND b.platform = ?)"
+            if platform is not None else ""
+        )
+        platform_args = (platform,) if platform is not None else ()
+
+        exact = self.conn.execute(
+            f"SELECT a.identity_id, a.username FROM aliases AS a WHERE a.norm = ? {other_platform}",
+            (norm, *platform_args),
+        ).fetchall()
+        if exact:
+            return [(identity_id, alias, 100.0) for identity_id, alias in exact]
+
+        grams = self._selective_grams(trigrams(norm))
+        if not grams:
+            return []
+        min_shared = max(1, len(grams) // 3)
+
+        # The platform filter runs before LIMIT, so aliases of identities
+        # that are already taken on this platform cannot crowd out the
+        # real match.
+        rows = self.conn.execute(
+            f"""
+            SELECT a.identity_id, a.username, a.norm
+            FROM (
+                SELECT g.alias_id, COUNT(*) AS shared
+                FROM trigrams AS g
+                JOIN aliases AS a ON a.id = g.alias_id
+                WHERE g.gram IN ({",".join("?" * len(grams))}) {other_platform}
+                GROUP BY g.alias_id
+                HAVING shared >= ?
+                ORDER BY shared DESC
+                LIMIT ?
+            ) AS t
+            JOIN aliases AS a ON a.id = t.alias_id
+            """,
+            (*grams, *platform_args, min_shared, self.max_candidates),
+        ).fetchall()
+
+        scored = []
+        for identity_id, alias, alias_norm in rows:
+            score = fuzz.ratio(norm, alias_norm)
+            if score >= self.threshold:
+                scored.append((identity_id, alias, score))
+        scored.sort(key=lambda x: -x[2])
+        return scored
+
+    def _add_alias(self, identity_id: int, platform: str, username: str, norm: str, now: float) -> None:
+        cursor = self.conn.execute(
+            "INSERT INTO aliases (identity_id, platform, username, norm, first_seen, last_seen) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (identity_id, platform, username, norm, now, now),
+        )
+        alias_id = cursor.lastrowid
+        grams = trigrams(norm)
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO trigrams (gram, alias_id) VALUES (?, ?)",
+            ((gram, alias_id) for gram in grams),
+        )
+        self.conn.executemany(
+            "INSERT INTO gram_counts (gram, n) VALUES (?, 1) ON CONFLICT(gram) DO UPDATE SET n = n + 1",
+            ((gram,) for gram in grams),
+        )
+
+    def resolve(self, platform: str, username: str) -> int:
+        """
+        Returns the identity id for ``username`` on ``platform``. Unknown
+        usernames join the best matching identity or start a new one.
+        """
+        norm = normalize(username)
+        now = time.time()
+
+        known = self._alias(platform, norm)
+        if known is not None:
+            alias_id, identity_id = known
+            self.conn.execute("UPDATE aliases SET last_seen = ? WHERE id = ?", (now, alias_id))
+            return identity_id
+
+        matches = self.candidates(username, platform=platform)
+        if matches:
+            identity_id = matches[0][0]
+        else:
+            identity_id = self.conn.execute(
+                "INSERT INTO identities (canonical, created_at) VALUES (?, ?)", (norm, now)
+            ).lastrowid
+
+        self._add_alias(identity_id, platform, username, norm, now)
+        return identity_id
+
+    def resolve_many(self, entries: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        """
+        Resolves (platform, username) pairs in a single transaction.
+        """
+        resolved: Dict[Tuple[str, str], int] = {}
+        with self.conn:
+            for platform, username in entries:
+                key = (platform, username)
+                if key not in resolved:
+                    resolved[key] = self.resolve(platform, username)
+        return resolved
+
+    def resolve_card(self, card: social_model) -> Dict[Tuple[str, str], int]:
+        def entries():
+            if card.m_username:
+                yield card.m_platform, card.m_username
+            for field in ("m_followers", "m_following", "m_mutual_usernames"):
+                for username in getattr(card, field) or []:
+                    yield card.m_platform, username
+
+        return self.resolve_many(entries())
+
+    def aliases(self, identity_id: int) -> List[Tuple[str, str]]:
+        return self.conn.execute(
+            "SELECT platform, username FROM aliases WHERE identity_id = ? ORDER BY platform, username",
+            (identity_id,),
+        ).fetchall()
+
+    def stats(self) -> Dict[str, int]:
+        identities, = self.conn.execute("SELECT COUNT(*) FROM identities").fetchone()
+        aliases, = self.conn.execute("SELECT COUNT(*) FROM aliases").fetchone()
+        return {"identities": identities, "aliases": aliases}
@@ -0,0 +1,235 @@
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional
+
+from models import social_model
+
+try:
+    import numpy as np
+    import scipy.sparse as sp
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+RELATIONS = ("follower", "following", "mutual")
+RELATION_FIELDS = (
+    ("m_followers", 0),
+    ("m_following", 1),
+    ("m_mutual_usernames", 2),
+)
+SCORINGS = ("pagerank", "degree", "legacy")
+
+
+def normalize_username(username: str) -> str:
+    return username.lower().strip()
+
+
+class InfluenceGraph:
+    """
+    Sparse user-by-user graph built from cards.
+
+    Every listed connection is stored once as an edge from the crawled
+    profile (source) to the listed user (target), with platform and
+    relation kept as parallel edge attributes. Follow direction is derived
+    from the relation when the adjacency matrix is built: a follower points
+    at the source, a following is pointed at by the source, and a mutual
+    goes both ways.
+
+    Usernames are merged on their normalized form (or on the identity key
+    returned by ``key``), not by pairwise fuzzy matching.
+
+    Crawled profiles become nodes too, so they take part in PageRank, but
+    a profile that never shows up in anyone's list is left out of the
+    rankings (see ``listed``).
+    """
+
+    def __init__(self, key: Optional[Callable[[str], str]] = None):
+        if np is None:
+            raise ImportError("InfluenceGraph requires numpy and scipy: pip install numpy scipy")
+
+        self._key = key or normalize_username
+        self._index: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.platforms: List[str] = []
+        self._platform_index: Dict[str, int] = {}
+
+        self._src = array("q")
+        self._dst = array("q")
+        self._platform = array("q")
+        self._relation = array("b")
+        self._cache = {}
+
+    @classmethod
+    def from_cards(cls, cards: Iterable[social_model], key=None) -> "InfluenceGraph":
+        graph = cls(key=key)
+        for card in cards:
+            graph.add_card(card)
+        return graph
+
+    def _node(self, username: str) -> int:
+        node_key = self._key(username)
+        index = self._index.get(node_key)
+        if index is None:
+            index = len(self.names)
+            self._index[node_key] = index
+            self.names.append(node_key)
+        return index
+
+    def add_card(self, card: social_model) -> None:
+        platform = self._platform_index.get(card.m_platform)
+        if platform is None:
+            platform = len(self.platforms)
+            self._platform_index[card.m_platform] = platform
+            self.platforms.append(card.m_platform)
+
+        source_name = card.m_username or (card.m_weblink[0] if card.m_weblink else card.m_platform)
+        source = self._node(source_name)
+
+        for field, relation in RELATION_FIELDS:
+            for username in getattr(card, field) or []:
+                self._src.append(source)
+                self._dst.append(self._node(username))
+                self._platform.append(platform)
+                self._relation.append(relation)
+
+        self._cache.clear()
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.names)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self._src)
+
+    def _edges(self):
+        if "edges" not in self._cache:
+            # Copies, not frombuffer views: a view would pin the arrays and
+            # make the next add_card() fail with BufferError.
+            self._cache["edges"] = (
+                np.array(self._src, dtype=np.int64),
+                np.array(self._dst, dtype=np.int64),
+                np.array(self._platform, dtype=np.int64),
+                np.array(self._relation, dtype=np.int8),
+            )
+        return self._cache["edges"]
+
+    def adjacency(self):
+        """
+        Returns the n x n follow matrix in CSR form, A[i, j] = 1 when user i
+        follows user j. A follow seen several times (a mutual user is also
+        listed under followers and following, or a user is listed on two
+        platforms) counts once.
+        """
+        if "adjacency" not in self._cache:
+            src, dst, _, relation = self._edges()
+            follower = relation == 0
+            following = relation == 1
+            mutual = relation == 2
+
+            rows = np.concatenate([dst[follower], src[following], src[mutual], dst[mutual]])
+            cols = np.concatenate([src[follower], dst[following], dst[mutual], src[mutual]])
+            data = np.ones(len(rows), dtype=np.float64)
+
+            n = self.num_nodes
+            adjacency = sp.csr_matrix((data, (rows, cols)), shape=(n, n))
+            adjacency.sum_duplicates()
+            adjacency.data[:] = 1.0
+            self._cache["adjacency"] = adjacency
+        return self._cache["adjacency"]
+
+    def in_degree(self):
+        return np.asarray(self.adjacency().sum(axis=0)).ravel()
+
+    def out_degree(self):
+        return np.asarray(self.adjacency().sum(axis=1)).ravel()
+
+    def relation_counts(self):
+        """
+        Returns an n x 3 array counting how often each user was listed as
+        follower, following and mutual.
+        """
+        _, dst, _, relation = self._edges()
+        counts = np.zeros((self.num_nodes, len(RELATIONS)), dtype=np.int64)
+        np.add.at(counts, (dst, relation), 1)
+        return counts
+
+    def listed(self):
+        """
+        Boolean mask of users that appear in at least one card's lists.
+        Crawled profiles that were only ever a source are False.
+        """
+        _, dst, _, _ = self._edges()
+        mask = np.zeros(self.num_nodes, dtype=bool)
+        mask[dst] = True
+        return mask
+
+    def mutual_counts(self):
+        return self.relation_counts()[:, 2]
+
+    def platform_diversity(self):
+        _, dst, platform, _ = self._edges()
+        seen = sp.csr_matrix(
+            (np.ones(len(dst)), (dst, platform)),
+            shape=(self.num_nodes, max(len(self.platforms), 1)),
+        )
+        return np.diff(seen.indptr)
+
+    def node_platforms(self, index: int) -> List[str]:
+        src, dst, platform, _ = self._edges()
+        codes = np.unique(platform[(dst == index) | (src == index)])
+        return [self.platforms[c] for c in codes]
+
+    def pagerank(self, damping: float = 0.85, tol: float = 1e-8, max_iter: int = 100):
+        n = self.num_nodes
+        if n == 0:
+            return np.zeros(0)
+
+        adjacency = self.adjacency()
+        out = np.asarray(adjacency.sum(axis=1)).ravel()
+        dangling = out == 0
+        inv_out = np.divide(1.0, out, out=np.zeros_like(out), where=~dangling)
+        transition = sp.diags(inv_out) @ adjacency
+
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            leaked = rank[dangling].sum()
+            updated = damping * (transition.T @ rank + leaked / n) + (1.0 - damping) / n
+            if np.abs(updated - rank).sum() < tol:
+                rank = updated
+                break
+            rank = updated
+        return rank
+
+    def legacy_scores(self):
+        """
+        The original hand-tuned influence formula, computed for all users
+        at once.
+        """
+        counts = self.relation_counts()
+        connection_diversity = (counts > 0).sum(axis=1)
+        network_score = counts[:, 0] * 1.5 + counts[:, 2] * 2.0 + counts[:, 1] * 0.5
+        return self.platform_diversity() * 10 + connection_diversity * 5 + network_score
+
+    def scores(self, scoring: str = "pagerank"):
+        if scoring == "pagerank":
+            return self.pagerank()
+        if scoring == "degree":
+            return self.in_degree() + self.out_degree()
+        if scoring == "legacy":
+            return self.legacy_scores()
+        raise ValueError(f"Unknown scoring '{scoring}', expected one of {SCORINGS}")
+
+    def top_k(self, scores, k: int = 10, mask=None):
+        """
+        Returns the indices of the k highest scores, best first, without
+        sorting the full score vector.
+        """
+        candidates = np.arange(len(scores)) if mask is None else np.flatnonzero(mask)
+        if k <= 0 or len(candidates) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        values = scores[candidates]
+        if len(candidates) > k:
+            part = np.argpartition(-values, k - 1)[:k]
+            candidates, values = candidates[part], values[part]
+        return candidates[np.argsort(-values, kind="stable")]
@@ -3,6 +3,8 @@ import gzip
 import json
 from playwright.sync_api import Page
 
+import page_helpers
+
 
 class SessionManager:
     def __init__(self, session_file="session_data.json.gz"):
@@ -11,16 +13,7 @@ class SessionManager:
         self._pending_session = {}
 
     def safe_get_storage(self, page: Page, storage_type: str):
-        script = f"""
-        () => {{
-            try {{
-                return Object.assign({{}}, window.{storage_type});
-            }} catch (e) {{
-                return null;
-            }}
-        }}
-        """
-        return page.evaluate(script)
+        return page_helpers.call(page, "readStorage", storage_type)
 
     def save(self, page: Page):
         state = {
@@ -52,10 +45,7 @@ class SessionManager:
         return True
 
     def apply_storage(self, page: Page):
-        for k, v in self._pending_local.items():
-            page.evaluate(f"() => localStorage.setItem('{k}', '{v}')")
-
-        for k, v in self._pending_session.items():
-            page.evaluate(f"() => sessionStorage.setItem('{k}', '{v}')")
+        page_helpers.call(page, "writeStorage", "localStorage", self._pending_local)
+        page_helpers.call(page, "writeStorage", "sessionStorage", self._pending_session)
 
         print(f"[✔] Storage applied from {self.session_file}")
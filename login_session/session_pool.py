@@ -0,0 +1,225 @@
+import os
+import glob
+import json
+import time
+import threading
+from typing import Callable, Dict, List, Optional
+
+from login_session.session_manager import SessionManager
+
+
+LOGIN_MARKERS = ("/login", "login.php", "/accounts/login", "/checkpoint")
+THROTTLE_MARKERS = ("429", "too many requests", "rate limit", "try again later", "temporarily blocked")
+
+
+class NoSessionAvailable(Exception):
+    pass
+
+
+def looks_logged_out(url: str) -> bool:
+    return any(marker in url.lower() for marker in LOGIN_MARKERS)
+
+
+def failure_outcome(error: BaseException, url: str = "") -> str:
+    """
+    Maps a failed crawl to a lease outcome. A login wall means the session
+    expired, rate-limit responses mean the account is throttled, and
+    anything else is a plain failure that counts towards max_failures.
+    """
+    if looks_logged_out(url):
+        return "expired"
+    message = str(error).lower()
+    if any(marker in message or marker in url.lower() for marker in THROTTLE_MARKERS):
+        return "throttled"
+    return "failed"
+
+
+class SessionLease:
+    """
+    One account handed to one worker. Use as a context manager; leaving the
+    block returns the account to the pool. An exception inside the block
+    counts as a failure unless the outcome was already set.
+    """
+
+    def __init__(self, pool: "SessionPool", account: str, path: str):
+        self.pool = pool
+        self.account = account
+        self.manager = SessionManager(path)
+        self.outcome = None
+
+    def mark(self, outcome: str) -> None:
+        """
+        outcome is one of "ok", "throttled", "expired" or "failed".
+        """
+        self.outcome = outcome
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.outcome is None:
+            self.outcome = "failed" if exc_type else "ok"
+        self.pool.release(self)
+
+
+class SessionPool:
+    """
+    Manages several stored sessions for one platform and leases them to
+    concurrent workers, one worker per account at a time.
+
+    Sessions live in ``<directory>/<platform>/<account>.json.gz``. The
+    legacy single file ``<platform>_session.json.gz`` is picked up as the
+    "default" account. Health is kept in ``pool_state.json`` next to the
+    sessions:
+
+    - throttled accounts cool down for ``cooldown`` seconds;
+    - ``max_failures`` consecutive failures also trigger a cooldown;
+    - expired sessions, or files older than ``max_age``, are handed to
+      ``refresh(manager)``. The account is retired when there is no
+      refresher or the refresh fails.
+    """
+
+    def __init__(self, platform: str, directory: str = "sessions", cooldown: float = 900,
+                 max_failures: int = 3, max_age: float = 30 * 24 * 3600,
+                 refresh: Optional[Callable[[SessionManager], bool]] = None):
+        self.platform = platform
+        self.directory = os.path.join(directory, platform)
+        self.cooldown = cooldown
+        self.max_failures = max_failures
+        self.max_age = max_age
+        self.refresh = refresh
+
+        self._lock = threading.Condition()
+        self._leased = set()
+        self._state_path = os.path.join(self.directory, "pool_state.json")
+        self._state: Dict[str, dict] = {}
+
+        if os.path.exists(self._state_path):
+            with open(self._state_path, encoding="utf-8") as f:
+                self._state = json.load(f)
+
+    def _paths(self) -> Dict[str, str]:
+        paths = {
+            os.path.basename(path)[:-len(".json.gz")]: path
+            for path in glob.glob(os.path.join(self.directory, "*.json.gz"))
+        }
+        legacy = f"{self.platform}_session.json.gz"
+        if os.path.exists(legacy):
+            paths.setdefault("default", legacy)
+        return paths
+
+    def _health(self, account: str) -> dict:
+        return self._state.setdefault(account, {
+            "failures": 0, "cooldown_until": 0.0, "retired": False, "last_used": 0.0,
+        })
+
+    def _save_state(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self._state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, indent=2)
+        os.replace(tmp_path, self._state_path)
+
+    def add_account_path(self, account: str) -> str:
+        """
+        Where a new login for ``account`` should be saved with
+        SessionManager.save().
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, f"{account}.json.gz")
+
+    def accounts(self) -> List[str]:
+        with self._lock:
+            return [a for a in self._paths() if not self._health(a)["retired"]]
+
+    def _pick(self, paths: Dict[str, str]) -> Optional[str]:
+        now = time.time()
+        ready = [
+            account for account in paths
+            if account not in self._leased
+            and not self._health(account)["retired"]
+            and self._health(account)["cooldown_until"] <= now
+        ]
+        if not ready:
+            return None
+        # Least recently used first spreads load evenly across accounts.
+        return min(ready, key=lambda a: self._health(a)["last_used"])
+
+    def lease(self, timeout: Optional[float] = None) -> SessionLease:
+        deadline = None if timeout is None else time.time() + timeout
+
+        with self._lock:
+            while True:
+                paths = self._paths()
+                if not any(not self._health(a)["retired"] for a in paths):
+                    raise NoSessionAvailable(f"No usable {self.platform} sessions in {self.directory}")
+
+                account = self._pick(paths)
+                if account is not None:
+                    break
+
+                waits = [
+                    self._health(a)["cooldown_until"] - time.time()
+                    for a in paths if a not in self._leased and not self._health(a)["retired"]
+                ]
+                wait = min([w for w in waits if w > 0], default=None)
+                if deadline is not None:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise NoSessionAvailable(f"No {self.platform} session free within {timeout}s")
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._lock.wait(wait)
+
+            self._leased.add(account)
+            self._health(account)["last_used"] = time.time()
+            path = paths[account]
+
+        if time.time() - os.path.getmtime(path) > self.max_age:
+            lease = SessionLease(self, account, path)
+            lease.mark("expired")
+            self.release(lease)
+            return self.lease(timeout=None if deadline is None else max(deadline - time.time(), 0))
+
+        print(f"[SessionPool] Leased {self.platform}/{account}")
+        return SessionLease(self, account, path)
+
+    def release(self, lease: SessionLease) -> None:
+        account = lease.account
+        outcome = lease.outcome or "ok"
+
+        refreshed = False
+        if outcome == "expired" and self.refresh is not None:
+            try:
+                refreshed = bool(self.refresh(lease.manager))
+            except Exception as e:
+                print(f"[SessionPool] Refresh failed for {self.platform}/{account}: {e}")
+
+        with self._lock:
+            health = self._health(account)
+
+            if outcome == "ok":
+                health["failures"] = 0
+            elif outcome == "throttled":
+                health["cooldown_until"] = time.time() + self.cooldown
+            elif outcome == "failed":
+                health["failures"] += 1
+                if health["failures"] >= self.max_failures:
+                    health["failures"] = 0
+                    health["cooldown_until"] = time.time() + self.cooldown
+            elif outcome == "expired":
+                if refreshed:
+                    health["failures"] = 0
+                    os.utime(lease.manager.session_file)
+                else:
+                    health["retired"] = True
+                    print(f"[SessionPool] Retired expired session {self.platform}/{account}")
+
+            self._leased.discard(account)
+            self._save_state()
+            self._lock.notify_all()
+
+    def retire(self, account: str) -> None:
+        with self._lock:
+            self._health(account)["retired"] = True
+            self._save_state()
+            self._lock.notify_all()
@@ -1,18 +1,33 @@
+import time
+import argparse
+import queue
+import threading
 from playwright.sync_api import sync_playwright
 from cross_platform_mapping import cross_platform_mapper
+from mapping_report import render_comparisons, render_identity_groups, render_influence
 from login_session.session_manager import SessionManager
+from login_session.session_pool import SessionPool, NoSessionAvailable, failure_outcome, looks_logged_out
+from pipeline import run_stream
+from identity_store import IdentityStore
+from fixture_replay import FixtureRecorder, FixtureReplayer
+from profiling import StageProfiler, NullProfiler
+from deadline import LatencyTracker
+import page_helpers
 from scrapers.behance_scraper import BehanceScraper
+from scrapers.behance_http import prefetch_profiles
 from scrapers.instagram import instagram
 from scrapers._facebook import FacebookScraper
 
 
-def run_scraper(scraper, page):
+def run_scraper(scraper, page, sinks=(), login=True, budget=None, tracker=None, lease=None) -> bool:
     print(f"\n>> Running scraper: {scraper.__class__.__name__}")
+    page_helpers.install(page.context)
 
-    page.goto(scraper.seed_url, wait_until="domcontentloaded")
+    if not scraper.browserless:
+        page.goto(scraper.seed_url, wait_until="domcontentloaded")
 
-    if getattr(scraper, "requires_login", False):
-        session = SessionManager(f"{scraper.__class__.__name__}_session.json.gz")
+    if login and getattr(scraper, "requires_login", False):
+        session = lease.manager if lease else SessionManager(f"{scraper.__class__.__name__}_session.json.gz")
         loaded = session.load(page)
 
         if not loaded:
@@ -23,30 +38,190 @@ def run_scraper(scraper, page):
             session.apply_storage(page)
             page.reload()
 
-    scraper.parse_page(page)
-    print(f">> Finished: {scraper.__class__.__name__}")
+            if lease is not None and looks_logged_out(page.url):
+                print(f">> Session {lease.account} for {scraper.__class__.__name__} is logged out")
+                lease.mark("expired")
+                return False
+
+    # The budget starts after login so a manual login does not eat into it.
+    scraper.start_deadline(budget)
+    started = time.monotonic()
+
+    try:
+        run_stream(scraper, page, sinks)
+    except Exception as e:
+        if scraper.budget_exceeded(e):
+            print(f">> Time budget reached before {scraper.__class__.__name__} could build a card; rerun to resume.")
+            return True
+        print(f">> Failed: {scraper.__class__.__name__} ({e}). Partial lists are checkpointed; rerun to resume.")
+        if lease is not None:
+            lease.mark(failure_outcome(e, page.url))
+        return False
+    finally:
+        if tracker is not None:
+            tracker.record(scraper.name, time.monotonic() - started, scraper.partial)
+
+    if scraper.partial:
+        print(f">> Time budget reached: {scraper.__class__.__name__} returned partial lists; rerun to resume.")
+    else:
+        print(f">> Finished: {scraper.__class__.__name__}")
+    return True
+
+
+def run_parallel(scrapers, workers: int, profiler=NullProfiler(), budget=None, tracker=None,
+                 max_attempts: int = 3) -> None:
+    """
+    Runs scrapers on ``workers`` threads, each with its own browser.
+    Authenticated scrapers lease an account from the platform's
+    SessionPool, so each account is used by one worker at a time and
+    throughput grows with the number of stored sessions. A scraper whose
+    account turns out expired or throttled is queued again, up to
+    ``max_attempts`` runs, and picks up another account from its checkpoint.
+    """
+    jobs = queue.Queue()
+    for scraper in scrapers:
+        jobs.put((scraper, 1))
+
+    pools = {}
+    pools_lock = threading.Lock()
+
+    def pool_for(scraper) -> SessionPool:
+        platform = scraper.__class__.__name__
+        with pools_lock:
+            if platform not in pools:
+                pools[platform] = SessionPool(platform)
+            return pools[platform]
+
+    def worker():
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+
+            while True:
+                try:
+                    scraper, attempt = jobs.get_nowait()
+                except queue.Empty:
+                    break
+
+                context = browser.new_context()
+                page = context.new_page()
+                try:
+                    if scraper.requires_login:
+                        try:
+                            lease = pool_for(scraper).lease(timeout=3600)
+                        except NoSessionAvailable as e:
+                            print(f">> Skipped: {scraper.__class__.__name__} ({e})")
+                            continue
+
+                        with lease, profiler.stage(f"scraper_{scraper.name}"):
+                            ok = run_scraper(scraper, page, lease=lease, budget=budget, tracker=tracker)
+
+                        if not ok and lease.outcome in ("expired", "throttled"):
+                            if attempt < max_attempts:
+                                print(f">> Retrying {scraper.__class__.__name__} on another account "
+                                      f"(attempt {attempt + 1}/{max_attempts})")
+                                jobs.put((scraper, attempt + 1))
+                            else:
+                                print(f">> Giving up on {scraper.__class__.__name__} after {attempt} attempts")
+                    else:
+                        with profiler.stage(f"scraper_{scraper.name}"):
+                            run_scraper(scraper, page, budget=budget, tracker=tracker)
+                finally:
+                    context.close()
+
+            browser.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(max(workers, 1))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def report(profiler=NullProfiler()):
+    with profiler.stage("mapper_compare_following"):
+        render_comparisons(cross_platform_mapper.compare_following_across_platforms())
+    with profiler.stage("mapper_group_following"):
+        render_identity_groups(cross_platform_mapper.group_following_across_all_platforms())
+    with profiler.stage("mapper_influence"):
+        render_influence(cross_platform_mapper.analyze_cross_platform_influence())
+
+    with profiler.stage("identity_store_resolve"), IdentityStore("identities.sqlite") as store:
+        resolved = cross_platform_mapper.resolve_identities(store)
+        print(f">> Resolved {len(resolved)} usernames against history: {store.stats()}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the social scrapers.")
+    parser.add_argument("--record", metavar="DIR",
+                        help="record network traffic (HAR) and per-round HTML snapshots to DIR")
+    parser.add_argument("--replay", metavar="DIR",
+                        help="serve a recording from DIR instead of the network")
+    parser.add_argument("--latency", type=int, default=0, metavar="MS",
+                        help="fixed delay per replayed request")
+    parser.add_argument("--workers", type=int, default=1, metavar="N",
+                        help="run scrapers on N parallel browsers using pooled sessions (sessions/<Scraper>/)")
+    parser.add_argument("--profile", nargs="?", const="profiles", metavar="DIR",
+                        help="cProfile each scraper and mapper analysis, writing stats to DIR (default: profiles)")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="with --profile, also record tracemalloc allocation hotspots")
+    parser.add_argument("--time-budget", type=float, metavar="SECONDS",
+                        help="stop each scraper after SECONDS and keep what it collected (marked m_partial)")
+    args = parser.parse_args()
+
+    if args.workers > 1 and (args.record or args.replay):
+        parser.error("--record and --replay run on a single browser; drop --workers")
+    return args
 
 
 def main():
+    args = parse_args()
+
     scrapers = [
-        BehanceScraper(username="grapheine"),
+        BehanceScraper(username="grapheine", engine="browser" if args.replay or args.record else "http"),
         FacebookScraper(username="profile.php?id=100081288807680&sk"),
         instagram(username="nazarali870"),
 
     ]
 
+    recorder = FixtureRecorder(args.record) if args.record else None
+    replayer = FixtureReplayer(args.replay, latency_ms=args.latency) if args.replay else None
+
+    if replayer is None:
+        prefetch_profiles(scrapers, budget=args.time_budget)
+
+    profiler = StageProfiler(args.profile, memory=args.profile_memory) if args.profile else NullProfiler()
+    tracker = LatencyTracker()
+
+    if args.workers > 1:
+        run_parallel(scrapers, args.workers, profiler, budget=args.time_budget, tracker=tracker)
+        print(f">> Latency: {tracker.summary()}")
+        report(profiler)
+        return
+
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        page = browser.new_page()
+        browser = p.chromium.launch(headless=replayer is not None)
+        context = recorder.new_context(browser) if recorder else browser.new_context()
+        if replayer:
+            replayer.install(context)
+        page = context.new_page()
 
         for scraper in scrapers:
-            run_scraper(scraper, page)
+            if recorder:
+                recorder.attach(scraper)
+            with profiler.stage(f"scraper_{scraper.name}"):
+                run_scraper(scraper, page, login=replayer is None, budget=args.time_budget, tracker=tracker)
 
+        context.close()
+        if recorder:
+            recorder.scrub()
         browser.close()
 
-        cross_platform_mapper.compare_following_across_platforms()
-        cross_platform_mapper.group_following_across_all_platforms()
-        cross_platform_mapper.analyze_cross_platform_influence()
+        if replayer:
+            print(f">> Replay served {replayer.served} requests, {replayer.missed} not in recording")
+
+    print(f">> Latency: {tracker.summary()}")
+
+    report(profiler)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,156 @@
+from typing import Iterable, List, Optional
+
+from models import social_model
+from mapping_results import ResultSet, PlatformComparison, IdentityGroup, InfluenceResult
+
+
+def _preview(items: ResultSet, limit: Optional[int]) -> str:
+    """
+    Formats at most ``limit`` items and reports how many were left out,
+    so huge lists never get turned into one giant string.
+    """
+    if limit is None:
+        shown = items.to_list()
+        return f"({len(shown)}): {shown}"
+
+    shown = items.first(limit + 1)
+    if len(shown) <= limit:
+        return f"({len(shown)}): {shown}"
+
+    total = items.count()
+    return f"({total}): {shown[:limit]} ... +{total - limit} more"
+
+
+def render_cards(cards: Iterable[social_model]) -> None:
+    print("CROSS-PLATFORM MAPPING - ALL COLLECTED CARDS")
+
+    count = 0
+    for i, card in enumerate(cards, 1):
+        count = i
+        print(f"\n--- Card {i} ---")
+        print(f"Platform: {card.m_platform}")
+        print(f"Network: {card.m_network}")
+        print(f"Web Links: {card.m_weblink}")
+        print(f"Content Type: {card.m_content_type}")
+        print(f"Content: {card.m_content}")
+
+        if card.m_followers:
+            print(f"Followers ({len(card.m_followers)}): {card.m_followers}")
+        if card.m_following:
+            print(f"Following ({len(card.m_following)}): {card.m_following}")
+        if card.m_mutual_usernames:
+            print(f"Mutual Connections ({len(card.m_mutual_usernames)}): {card.m_mutual_usernames}")
+        if card.m_commenters:
+            print(f"Commenters ({len(card.m_commenters)}): {card.m_commenters}")
+        if card.m_post_likes:
+            print(f"Post Likes: {card.m_post_likes}")
+        if card.m_post_comments:
+            print(f"Post Comments: {card.m_post_comments}")
+        if card.m_post_views:
+            print(f"Post Views: {card.m_post_views}")
+        if card.m_views:
+            print(f"Views: {card.m_views}")
+        if card.m_total_followers_n is not None:
+            print(f"Total Followers: {card.m_total_followers_n:,}")
+        if card.m_total_following_n is not None:
+            print(f"Total Following: {card.m_total_following_n:,}")
+
+    if not count:
+        print("No cards collected.")
+        return
+
+    print(f"\nTotal cards collected: {count}")
+
+
+def render_comparisons(comparisons: ResultSet[PlatformComparison], limit: Optional[int] = 50) -> None:
+    print("CROSS-PLATFORM FOLLOWING COMPARISON (PAIRWISE)")
+
+    found = False
+    for comparison in comparisons:
+        found = True
+        p1, p2 = comparison.platform_a, comparison.platform_b
+
+        print(f"\n>>> {p1}  VS  {p2}")
+        print(f"Exact Matches {_preview(comparison.exact, limit)}")
+
+        # Cached: _preview() counts after taking the first items, and the
+        # fuzzy scan behind `similar` should only run once.
+        similar = ResultSet(
+            lambda c=comparison: ((s.username_a, s.username_b, f"{s.score}%") for s in c.similar),
+            cache=True,
+        )
+        print(f"Similar Matches {_preview(similar, limit)}")
+        print(f"Only on {p1} {_preview(comparison.only_a, limit)}")
+        print(f"Only on {p2} {_preview(comparison.only_b, limit)}")
+
+    if not found:
+        print("Not enough platforms with following data.")
+
+
+def render_identity_groups(groups: ResultSet[IdentityGroup], limit: Optional[int] = None) -> None:
+    print("GLOBAL USERNAME IDENTITY GROUPING")
+
+    shown: List[IdentityGroup] = groups.to_list() if limit is None else groups.first(limit)
+    if not shown:
+        print("No cross-platform identities found above threshold.")
+    else:
+        for idx, group in enumerate(shown, 1):
+            print(f"\nIdentity Group {idx}:")
+            for member in group.scored_members():
+                print(f"  {member.platform}: {member.username} ({member.confidence}%)")
+
+    print("\n" + "=" * 60)
+
+
+def render_influence(result: InfluenceResult, top_k: int = 10, bridges_k: int = 15) -> None:
+    print(f"CROSS-PLATFORM INFLUENCE & NETWORK INTELLIGENCE ({result.scoring.upper()} SCORING)")
+
+    stats = result.stats
+    if not stats.total_users:
+        print("No user data available for analysis.")
+        print("=" * 60)
+        return
+
+    print("\n>>> TOP CROSS-PLATFORM INFLUENCERS")
+    print("-" * 60)
+
+    for i, user in enumerate(result.top(top_k), 1):
+        print(f"\n{i}. Username Variations: {user.names}")
+        # Graph scores such as PageRank are tiny fractions; the fuzzy and
+        # legacy formulas keep their original one-decimal format.
+        score = f"{user.score:.1f}" if result.scoring in ("fuzzy", "legacy") else f"{user.score:.4g}"
+        print(f"   Influence Score: {score}")
+        print(f"   Platforms: {user.platforms}")
+        print(f"   Connection Types: {user.connection_types}")
+        print(f"   Network Stats: {user.follower_count} followers, "
+              f"{user.following_count} following, "
+              f"{user.mutual_count} mutual")
+
+        if user.platform_breakdown:
+            print("   Platform Breakdown:")
+            for plat, types in user.platform_breakdown.items():
+                print(f"      {plat}: {', '.join(types)}")
+
+    print("\n\n>>> CROSS-PLATFORM BRIDGE USERS (Multi-Platform Connectors)")
+    print("-" * 60)
+
+    for user in result.bridges(bridges_k):
+        print(f"  • {' / '.join(user.names)}")
+        print(f"    Bridges: {' ↔ '.join(user.platforms)}")
+        print(f"    Connection Types: {', '.join(user.connection_types)}")
+
+    print("\n\n>>> NETWORK STATISTICS")
+    print("-" * 60)
+
+    print(f"Total Unique Users: {stats.total_users}")
+    if stats.total_edges:
+        print(f"Total Edges: {stats.total_edges}")
+    print(f"Multi-Platform Users: {stats.multi_platform_users} "
+          f"({stats.multi_platform_users / stats.total_users * 100:.1f}%)")
+    print(f"Average Platforms per User: {stats.average_platforms:.2f}")
+
+    print("\nConnection Type Distribution:")
+    for conn_type, count in sorted(stats.connection_type_distribution.items(), key=lambda x: x[1], reverse=True):
+        print(f"  {conn_type}: {count} users")
+
+    print("\n" + "=" * 60)
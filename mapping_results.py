@@ -0,0 +1,139 @@
+import heapq
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class ResultSet(Generic[T]):
+    """
+    Lazily evaluated, re-iterable sequence of analysis results.
+
+    Nothing is computed until the caller iterates, asks for the top k
+    items or requests a page, and only as much as needed is produced.
+    With cache=True the first full pass is kept, for sources that are
+    expensive to recompute.
+    """
+
+    def __init__(self, source: Callable[[], Iterable[T]], cache: bool = False):
+        self._source = source
+        self._cache = cache
+        self._items: Optional[List[T]] = None
+        self._count: Optional[int] = None
+
+    @classmethod
+    def of(cls, items: Iterable[T]) -> "ResultSet[T]":
+        materialized = list(items)
+        result = cls(lambda: materialized)
+        result._items = materialized
+        result._count = len(result._items)
+        return result
+
+    def __iter__(self) -> Iterator[T]:
+        if self._items is not None:
+            return iter(self._items)
+        if self._cache:
+            self._items = list(self._source())
+            self._count = len(self._items)
+            return iter(self._items)
+        return iter(self._source())
+
+    def first(self, n: int) -> List[T]:
+        return list(islice(self, n))
+
+    def top(self, k: int, key: Callable[[T], float]) -> List[T]:
+        return heapq.nlargest(k, self, key=key)
+
+    def page(self, number: int, size: int = 50) -> List[T]:
+        start = (number - 1) * size
+        return list(islice(self, start, start + size))
+
+    def count(self) -> int:
+        if self._count is None:
+            self._count = sum(1 for _ in self)
+        return self._count
+
+    def to_list(self) -> List[T]:
+        return list(self)
+
+
+@dataclass
+class SimilarPair:
+    username_a: str
+    username_b: str
+    score: float
+
+
+@dataclass
+class PlatformComparison:
+    platform_a: str
+    platform_b: str
+    exact: ResultSet[str]
+    similar: ResultSet[SimilarPair]
+    only_a: ResultSet[str]
+    only_b: ResultSet[str]
+
+
+@dataclass
+class IdentityMember:
+    platform: str
+    username: str
+    confidence: float
+
+
+@dataclass
+class IdentityGroup:
+    members: List[Tuple[str, str]]
+
+    def scored_members(self) -> Iterator[IdentityMember]:
+        from rapidfuzz import fuzz
+
+        for platform, username in sorted(self.members):
+            scores = [
+                fuzz.ratio(username, other)
+                for _, other in self.members
+                if other != username
+            ]
+            yield IdentityMember(platform, username, max(scores) if scores else 100)
+
+
+@dataclass
+class Influencer:
+    names: List[str]
+    score: float
+    platforms: List[str]
+    connection_types: List[str]
+    follower_count: int = 0
+    following_count: int = 0
+    mutual_count: int = 0
+    platform_breakdown: Dict[str, List[str]] = field(default_factory=dict)
+
+
+@dataclass
+class NetworkStats:
+    total_users: int
+    total_edges: int = 0
+    multi_platform_users: int = 0
+    average_platforms: float = 0.0
+    connection_type_distribution: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class InfluenceResult:
+    """
+    Ranked influencers. ``ranker(k, bridges_only)`` returns the k best
+    entries, so callers only pay for the slice they ask for.
+    """
+    scoring: str
+    stats: NetworkStats
+    ranker: Callable[[int, bool], List[Influencer]]
+
+    def top(self, k: int = 10) -> List[Influencer]:
+        return self.ranker(k, False)
+
+    def bridges(self, k: int = 15) -> List[Influencer]:
+        return self.ranker(k, True)
+
+    def page(self, number: int, size: int = 50) -> List[Influencer]:
+        return self.top(number * size)[(number - 1) * size:]
@@ -1,6 +1,101 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field
-from datetime import date
+import re
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Any, Dict, Iterable, List, Optional
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
+from datetime import datetime, timezone
+
+
+# Raw string metric -> parsed integer counterpart.
+COUNT_FIELDS = {
+    "m_total_posts": "m_total_posts_n",
+    "m_total_followers": "m_total_followers_n",
+    "m_total_following": "m_total_following_n",
+    "m_post_likes": "m_post_likes_n",
+    "m_post_shares": "m_post_shares_n",
+    "m_post_comments_count": "m_post_comments_count_n",
+    "m_post_views": "m_post_views_n",
+    "m_views": "m_views_n",
+    "m_comment_count": "m_comment_count_n",
+    "m_likes": "m_likes_n",
+    "m_retweets": "m_retweets_n",
+}
+
+SUFFIXES = {
+    "k": 10 ** 3, "thousand": 10 ** 3, "tsd": 10 ** 3, "mil": 10 ** 3, "mille": 10 ** 3,
+    "tys": 10 ** 3, "тыс": 10 ** 3, "тис": 10 ** 3, "千": 10 ** 3, "천": 10 ** 3,
+    "万": 10 ** 4, "萬": 10 ** 4, "만": 10 ** 4, "lakh": 10 ** 5, "crore": 10 ** 7,
+    "m": 10 ** 6, "mn": 10 ** 6, "million": 10 ** 6, "millions": 10 ** 6, "mill": 10 ** 6,
+    "millón": 10 ** 6, "millones": 10 ** 6, "mi": 10 ** 6, "mio": 10 ** 6, "mln": 10 ** 6,
+    "млн": 10 ** 6, "亿": 10 ** 8, "億": 10 ** 8, "억": 10 ** 8,
+    "b": 10 ** 9, "bn": 10 ** 9, "bi": 10 ** 9, "billion": 10 ** 9, "mrd": 10 ** 9,
+    "md": 10 ** 9, "млрд": 10 ** 9,
+}
+
+# A number, then an optional word in any script ("K", "млн", "万",
+# "followers"), optionally abbreviated with a trailing dot.
+_COUNT_RE = re.compile(r"(\d[\d.,'\s\u00a0\u202f]*)\s*([^\W\d_]+\.?)?")
+
+
+def parse_count(value: Any) -> Optional[int]:
+    """
+    Parses display counts such as "1.2M", "12,345", "12.345", "1 234",
+    "3,5 K", "1,2 млн", "1.2万" or "987 followers". Returns None when
+    there is no number, or when an unrecognised word follows a decimal
+    ("1,2 xyz") or is abbreviated ("12 xyz."), since that word is then
+    an unknown multiplier rather than a label.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(Decimal(str(value)).to_integral_value(rounding=ROUND_HALF_UP))
+
+    match = _COUNT_RE.search(str(value).lower())
+    if not match:
+        return None
+
+    number = re.sub(r"['\s\u00a0\u202f]", "", match.group(1)).rstrip(".,")
+    word = match.group(2) or ""
+    multiplier = SUFFIXES.get(word.rstrip("."))
+    unknown_word = multiplier is None
+    if unknown_word:
+        if word.endswith("."):
+            return None
+        multiplier = 1
+
+    if "," in number and "." in number:
+        # Whichever separator comes last is the decimal point.
+        decimal = "," if number.rfind(",") > number.rfind(".") else "."
+        number = number.replace("." if decimal == "," else ",", "").replace(decimal, ".")
+    elif "," in number or "." in number:
+        sep = "," if "," in number else "."
+        head, _, tail = number.rpartition(sep)
+        # "12,345" and "1.234.567" group thousands, "1.2M" and "3,5" are decimals.
+        if multiplier == 1 and (number.count(sep) > 1 or len(tail) == 3):
+            number = number.replace(sep, "")
+        else:
+            number = f"{head.replace(sep, '')}.{tail}"
+
+    if unknown_word and word and "." in number:
+        return None
+
+    try:
+        # Decimal keeps "1.15K" exact; halves always round up ("2,5" -> 3).
+        return int((Decimal(number) * multiplier).to_integral_value(rounding=ROUND_HALF_UP))
+    except InvalidOperation:
+        return None
+
+
+def fill_counts(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Adds the parsed integer counterparts to a card dict, keeping any that
+    are already set.
+    """
+    for raw, parsed in COUNT_FIELDS.items():
+        if data.get(parsed) is None and data.get(raw) is not None:
+            data[parsed] = parse_count(data[raw])
+    return data
 
 
 class social_model(BaseModel):
@@ -32,4 +127,41 @@ class social_model(BaseModel):
     m_likes: Optional[str] = None
     m_retweets: Optional[str] = None
     m_commenters: List[str] = Field(default_factory=list)
-    m_mutual_usernames: List[str] = Field(default_factory=list)
\ No newline at end of file
+    m_mutual_usernames: List[str] = Field(default_factory=list)
+    m_partial: bool = False
+    m_crawled_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    # Parsed once at ingestion from the raw strings above, for numeric
+    # sorting and filtering.
+    m_total_posts_n: Optional[int] = None
+    m_total_followers_n: Optional[int] = None
+    m_total_following_n: Optional[int] = None
+    m_post_likes_n: Optional[int] = None
+    m_post_shares_n: Optional[int] = None
+    m_post_comments_count_n: Optional[int] = None
+    m_post_views_n: Optional[int] = None
+    m_views_n: Optional[int] = None
+    m_comment_count_n: Optional[int] = None
+    m_likes_n: Optional[int] = None
+    m_retweets_n: Optional[int] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _parse_counts(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return fill_counts(dict(data))
+        return data
+
+    @classmethod
+    def bulk(cls, rows: Iterable[Dict[str, Any]], validate: bool = False) -> List["social_model"]:
+        """
+        Builds many cards at once. Trusted scraper output skips validation
+        through model_construct (counts are still parsed). validate=True
+        checks the whole batch in a single TypeAdapter call instead.
+        """
+        if validate:
+            return _card_batch.validate_python(list(rows))
+        return [cls.model_construct(**fill_counts(dict(row))) for row in rows]
+
+
+_card_batch = TypeAdapter(List[social_model])
@@ -0,0 +1,104 @@
+import weakref
+from typing import Any, List, Optional, Sequence
+
+from playwright.sync_api import BrowserContext, Page
+
+
+# Installed into every document of a context, so collectors call helpers by
+# name with small JSON arguments instead of shipping their own script source
+# on every round. Results come back as compact arrays.
+#
+# A field is [selector, prop, index]:
+#   selector  ""       the row itself
+#             "^css"   row.closest(css)
+#             "css"    row.querySelector(css), or querySelectorAll(css)[index]
+#   prop      "text"   trimmed innerText (default)
+#             "@name"  getAttribute(name)
+#             other    the DOM property, e.g. "href" for the absolute URL
+HELPERS_JS = r"""
+(() => {
+    if (window.__scraperHelpers) return;
+
+    const pick = (row, [selector, prop, index]) => {
+        let el = row;
+        if (selector && selector.startsWith("^")) {
+            el = row.closest(selector.slice(1));
+        } else if (selector) {
+            el = index ? row.querySelectorAll(selector)[index] : row.querySelector(selector);
+        }
+        if (!el) return null;
+        if (!prop || prop === "text") return (el.innerText || "").trim();
+        if (prop.startsWith("@")) return el.getAttribute(prop.slice(1));
+        return el[prop] ?? null;
+    };
+
+    const helpers = {
+        extractRows(selector, fields) {
+            return Array.from(document.querySelectorAll(selector), row => fields.map(f => pick(row, f)));
+        },
+        scrollContainer(selector, factor) {
+            const el = selector ? document.querySelector(selector) : document.scrollingElement;
+            if (!el) return null;
+            el.scrollBy(0, el.clientHeight * factor);
+            return [el.scrollTop, el.scrollHeight];
+        },
+        readStorage(type) {
+            try {
+                return Object.assign({}, window[type]);
+            } catch (e) {
+                return null;
+            }
+        },
+        writeStorage(type, entries) {
+            try {
+                const pairs = Object.entries(entries || {});
+                for (const [key, value] of pairs) window[type].setItem(key, value);
+                return pairs.length;
+            } catch (e) {
+                return null;
+            }
+        },
+    };
+
+    Object.defineProperty(window, "__scraperHelpers", {value: helpers, enumerable: false});
+})();
+"""
+
+_CALL_JS = """
+([name, args]) => window.__scraperHelpers
+    ? [true, window.__scraperHelpers[name](...args)]
+    : [false, null]
+"""
+
+_installed = weakref.WeakSet()
+
+
+def install(context: BrowserContext) -> None:
+    """
+    Registers the helpers for every page and frame of the context. Safe to
+    call more than once.
+    """
+    if context in _installed:
+        return
+    context.add_init_script(script=HELPERS_JS)
+    _installed.add(context)
+
+
+def call(page: Page, name: str, *args) -> Any:
+    """
+    Runs a helper in one round trip. A document loaded before install()
+    gets the library injected on first use.
+    """
+    ready, result = page.evaluate(_CALL_JS, [name, list(args)])
+    if not ready:
+        page.evaluate(HELPERS_JS)
+        ready, result = page.evaluate(_CALL_JS, [name, list(args)])
+    return result
+
+
+def extract_rows(page: Page, selector: str, fields: Sequence[Sequence]) -> List[list]:
+    return call(page, "extractRows", selector, [list(f) for f in fields])
+
+
+def scroll_container(page: Page, selector: Optional[str], factor: float = 1) -> Optional[list]:
+    return call(page, "scrollContainer", selector, factor)
@@ -0,0 +1,125 @@
+import queue
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+
+from models import social_model
+
+
+LABEL_RELATIONS = {
+    "followers": "follower",
+    "following": "following",
+    "friends": "following",
+    "mutual": "mutual",
+}
+
+
+@dataclass
+class ConnectionBatch:
+    """
+    Connections discovered by one collector round. Scrapers yield these
+    while they crawl; the summary card follows once the crawl is done.
+    """
+    platform: str
+    source: str
+    relation: str
+    usernames: List[str]
+    crawled_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def edges(self):
+        for username in self.usernames:
+            yield self.platform, self.source, username, self.relation, self.crawled_at
+
+
+class QueuedSink:
+    """
+    Runs a sink on a background thread behind a bounded queue.
+
+    The scraper blocks on put() when the sink falls max_pending batches
+    behind, so a slow consumer throttles the crawl instead of letting
+    batches pile up in memory.
+    """
+
+    _DONE = object()
+
+    def __init__(self, sink, max_pending: int = 16):
+        self.sink = sink
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is self._DONE:
+                    return
+                if self._error is None:
+                    self.sink.write_batch(item)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def write_batch(self, batch: ConnectionBatch) -> None:
+        if self._error is not None:
+            raise self._error
+        self._queue.put(batch)
+
+    def close_stream(self, card: Optional[social_model] = None) -> None:
+        """
+        Waits until the queued batches of this scraper are written. The
+        worker keeps running, so the same sink can serve the next scraper.
+        """
+        self._queue.join()
+        if self._error is not None:
+            raise self._error
+        close = getattr(self.sink, "close_stream", None)
+        if close is not None:
+            close(card)
+
+    def close(self) -> None:
+        """
+        Stops the worker once the queue is drained. Call once, after the
+        last scraper; the wrapped sink is still closed by its owner.
+        """
+        if self._thread.is_alive():
+            self._queue.put(self._DONE)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+def run_stream(scraper, page, sinks: Iterable = ()) -> Optional[social_model]:
+    """
+    Pulls batches from scraper.stream_page() and hands each one to every
+    sink before the scraper continues. Returns the summary card.
+
+    A sink is any object with write_batch(batch); an optional
+    close_stream(card) is called once the scraper is done. Sinks are not
+    closed here, so one set can be passed to every scraper of a run; the
+    caller closes them at the end.
+    """
+    sinks = list(sinks)
+    stream = scraper.stream_page(page)
+    card = None
+
+    try:
+        while True:
+            try:
+                batch = next(stream)
+            except StopIteration as done:
+                card = done.value
+                break
+
+            for sink in sinks:
+                sink.write_batch(batch)
+    finally:
+        for sink in sinks:
+            close = getattr(sink, "close_stream", None)
+            if close is not None:
+                close(card)
+
+    return card
@@ -0,0 +1,103 @@
+import os
+import re
+import io
+import pstats
+import cProfile
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+
+# cProfile can only run one profiler per interpreter on recent Pythons, so
+# stages running on parallel workers are profiled one at a time.
+_active = threading.Lock()
+
+
+class StageProfiler:
+    """
+    Opt-in per-stage profiling.
+
+    Each stage writes ``<name>.prof``, a pstats dump that snakeviz,
+    flameprof or gprof2dot can turn into a flame graph. With memory=True
+    it also writes ``<name>.mem.txt`` with the top allocation sites from
+    tracemalloc. Every stage adds its hotspots to ``summary.txt``, and
+    splits wall time into Playwright (waiting on the browser) and
+    everything else (Python-side work).
+    """
+
+    def __init__(self, directory: str = "profiles", memory: bool = False, top: int = 15):
+        self.directory = directory
+        self.memory = memory
+        self.top = top
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, name: str, suffix: str) -> str:
+        safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+        return os.path.join(self.directory, f"{safe}{suffix}")
+
+    @contextmanager
+    def stage(self, name: str):
+        if not _active.acquire(blocking=False):
+            print(f"[Profiler] {name}: another stage is being profiled, skipping")
+            yield
+            return
+
+        profiler = cProfile.Profile()
+        if self.memory:
+            tracemalloc.start()
+
+        try:
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                snapshot, peak = None, 0
+                if self.memory:
+                    snapshot = tracemalloc.take_snapshot()
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+
+            self._write(name, profiler, snapshot, peak)
+        finally:
+            _active.release()
+
+    def _write(self, name: str, profiler: cProfile.Profile, snapshot, peak: int) -> None:
+        profiler.dump_stats(self._path(name, ".prof"))
+
+        stats = pstats.Stats(profiler)
+        total = stats.total_tt
+        browser = sum(
+            tottime
+            for (filename, _, funcname), (_, _, tottime, _, _) in stats.stats.items()
+            if "playwright" in filename or "greenlet" in filename
+            or "select.epoll" in funcname or "select.kqueue" in funcname or "_overlapped" in funcname
+        )
+
+        buffer = io.StringIO()
+        stats.stream = buffer
+        stats.sort_stats("tottime").print_stats(self.top)
+
+        lines = [
+            f"=== {name} ===",
+            f"total {total:.3f}s | playwright/browser {browser:.3f}s | python {total - browser:.3f}s",
+            buffer.getvalue().strip(),
+        ]
+
+        if snapshot is not None:
+            top_allocations = snapshot.statistics("lineno")[:self.top]
+            with open(self._path(name, ".mem.txt"), "w", encoding="utf-8") as f:
+                for stat in top_allocations:
+                    f.write(f"{stat}\n")
+            lines.insert(2, f"peak traced memory {peak / 1024 / 1024:.1f} MiB")
+
+        with open(os.path.join(self.directory, "summary.txt"), "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n\n")
+
+        print(f"[Profiler] {name}: {total:.2f}s total, {total - browser:.2f}s python-side")
+
+
+class NullProfiler:
+    @contextmanager
+    def stage(self, name: str):
+        yield
@@ -1,9 +1,7 @@
-import time
 from playwright.sync_api import Page
 
 from scrapers.base_scraper import BaseScraper
 from models import social_model
-from cross_platform_mapping import cross_platform_mapper
 
 
 class FacebookScraper(BaseScraper):
@@ -27,21 +25,17 @@ class FacebookScraper(BaseScraper):
 
     def _extract_names(self, page: Page):
         try:
-            name_spans = page.query_selector_all(
-                'span.x193iq5w.xeuugli.x13faqbe.x1vvkbs.x1lkfr7t.x1lbecb7.x1s688f.xzsf02u[dir="auto"]'
+            rows = self.extract_rows(
+                page,
+                'span.x193iq5w.xeuugli.x13faqbe.x1vvkbs.x1lkfr7t.x1lbecb7.x1s688f.xzsf02u[dir="auto"]',
+                [("", "text"), ("^a", "href")],
             )
 
             names = []
-            for span in name_spans:
-                name_text = span.inner_text().strip()
-                if not name_text:
+            for name_text, href in rows:
+                if not name_text or not href:
                     continue
 
-                parent_anchor = span.evaluate_handle('el => el.closest("a")')
-                if not parent_anchor:
-                    continue
-
-                href = parent_anchor.evaluate('el => el.href')
                 is_profile = (
                     'profile.php?id=' in href or
                     (href.count('/') >= 3 and '?' not in href.split('/')[-1])
@@ -57,47 +51,95 @@ class FacebookScraper(BaseScraper):
             return []
 
     def _collect_friends(self, page: Page, max_items=50):
+        """
+        Yields after each scroll; the caller owns the wait between rounds.
+        """
         print(f"[Facebook] Collecting friends (max {max_items})...")
-        page.goto(self.seed_url, wait_until="networkidle", timeout=90000)
-        time.sleep(3)
 
-        collected = []
-        seen = set()
+        checkpoint = self.load_checkpoint("friends")
+        collected = checkpoint.get("items", [])
+        seen = set(collected)
+        rounds = checkpoint.get("rounds", 0)
         rounds_no_progress = 0
+        timed_out = False
 
-        while len(collected) < max_items and rounds_no_progress < 6:
-            names = self._extract_names(page)
-            added = 0
+        try:
+            page.goto(self.seed_url, wait_until="networkidle", timeout=self.deadline.timeout_ms(90000))
+            page.wait_for_timeout(self.deadline.timeout_ms(3000))
 
-            for name in names:
-                if name not in seen:
-                    seen.add(name)
-                    collected.append(name)
-                    print(f" → + {name} ({len(collected)}/{max_items})")
-                    added += 1
+            # Skip past the rows already collected before the interruption.
+            for _ in range(rounds):
+                if self.out_of_time():
+                    break
+                page.mouse.wheel(0, 2500)
+                page.wait_for_timeout(self.deadline.timeout_ms(500))
 
-                if len(collected) >= max_items:
+            while len(collected) < max_items and rounds_no_progress < 6:
+                if self.out_of_time():
+                    timed_out = True
                     break
 
-            rounds_no_progress = rounds_no_progress + 1 if added == 0 else 0
-            page.mouse.wheel(0, 2500)
-            time.sleep(2)
+                names = self._extract_names(page)
+                added = []
+
+                for name in names:
+                    if name not in seen:
+                        seen.add(name)
+                        collected.append(name)
+                        print(f" → + {name} ({len(collected)}/{max_items})")
+                        added.append(name)
+
+                    if len(collected) >= max_items:
+                        break
+
+                self.emit("friends", added)
+                rounds_no_progress = rounds_no_progress + 1 if not added else 0
+                page.mouse.wheel(0, 2500)
+                rounds += 1
+
+                if rounds % self.checkpoint_every == 0:
+                    self.save_checkpoint(
+                        "friends", collected, rounds=rounds,
+                        last_seen=collected[-1] if collected else None
+                    )
+
+                yield
+        except Exception as e:
+            if not self.budget_exceeded(e):
+                self.save_checkpoint(
+                    "friends", collected, rounds=rounds,
+                    last_seen=collected[-1] if collected else None
+                )
+                raise
+            timed_out = True
+
+        if timed_out:
+            self.save_checkpoint(
+                "friends", collected, rounds=rounds,
+                last_seen=collected[-1] if collected else None
+            )
+        else:
+            self.clear_checkpoint("friends")
 
         return collected[:max_items]
 
-    def parse_page(self, page: Page):
-        friends = self._collect_friends(page, max_items=50)
+    def stream_page(self, page: Page):
+        friends, = yield from self.stream_interleaved(
+            page, [self._collect_friends(page, max_items=50)], wait_ms=2000
+        )
         print(f"[Facebook] Friends collected: {len(friends)}")
+        yield self.batch("mutual", friends)
 
         card = social_model(
+            m_username=self._username,
             m_weblink=[self.seed_url],
             m_content=f"Friends: {friends}",
             m_content_type=["facebook_friends"],
             m_network="clearnet",
             m_platform="facebook",
             m_following=friends,
-            m_mutual_usernames=friends
+            m_mutual_usernames=friends,
+            m_partial=self.partial
         )
 
-        self.data.append(card.model_dump())
-        cross_platform_mapper.add_card(card)
+        return self.publish(card)
@@ -1,12 +1,25 @@
 from abc import ABC, abstractmethod
-from playwright.sync_api import Page
+from typing import Generator, List, Optional
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+from checkpoint_store import checkpoint_store
+import page_helpers
+from deadline import Deadline
+from cross_platform_mapping import cross_platform_mapper
+from models import social_model
+from pipeline import ConnectionBatch, LABEL_RELATIONS
 
 
 class BaseScraper(ABC):
     def __init__(self):
         self.data = []
+        self._outbox = []
+        self.deadline = Deadline()
+        self.partial = False
 
     requires_login: bool = False
+    browserless: bool = False
+    checkpoint_every: int = 3
+    round_hook = None
 
     @property
     @abstractmethod
@@ -23,6 +36,150 @@ class BaseScraper(ABC):
     def name(self) -> str:
         pass
 
-    @abstractmethod
     def parse_page(self, page: Page) -> None:
-        pass
+        """
+        Runs the whole crawl and stores the summary card. Scrapers implement
+        either this or stream_page().
+        """
+        self._require_override()
+        for _ in self.stream_page(page):
+            pass
+
+    def stream_page(self, page: Page) -> Generator[ConnectionBatch, None, Optional[social_model]]:
+        """
+        Yields ConnectionBatch objects as connections are discovered and
+        returns the summary card. The default wraps parse_page() and
+        streams nothing.
+        """
+        self._require_override()
+        self.parse_page(page)
+        return None
+        yield
+
+    def _require_override(self) -> None:
+        # Each default delegates to the other, so one of them must be overridden.
+        cls = type(self)
+        if cls.parse_page is BaseScraper.parse_page and cls.stream_page is BaseScraper.stream_page:
+            raise NotImplementedError(f"{cls.__name__} must implement parse_page() or stream_page()")
+
+    def batch(self, label: str, usernames: List[str]) -> ConnectionBatch:
+        return ConnectionBatch(
+            platform=self.name.lower(),
+            source=getattr(self, "_username", ""),
+            relation=LABEL_RELATIONS.get(label, label),
+            usernames=list(usernames),
+        )
+
+    def emit(self, label: str, usernames: List[str]) -> None:
+        """
+        Called by collectors with the usernames that are new this round.
+        """
+        if usernames:
+            self._outbox.append((label, list(usernames)))
+
+    def publish(self, card: social_model) -> social_model:
+        self.data.append(card.model_dump())
+        cross_platform_mapper.add_card(card)
+        return card
+
+    def start_deadline(self, budget: Optional[float]) -> None:
+        self.deadline = Deadline(budget)
+        self.partial = False
+
+    def out_of_time(self) -> bool:
+        """
+        Checked by collectors between rounds. Once the budget is spent the
+        collector stops and the card is flagged as partial.
+        """
+        if self.deadline.expired():
+            self.partial = True
+            return True
+        return False
+
+    def extract_rows(self, page: Page, selector: str, fields) -> List[list]:
+        """
+        One row per element matching ``selector``, one value per field.
+        See page_helpers for the field format.
+        """
+        return page_helpers.extract_rows(page, selector, fields)
+
+    def scroll_container(self, page: Page, selector: Optional[str], factor: float = 1):
+        return page_helpers.scroll_container(page, selector, factor)
+
+    def budget_exceeded(self, error: BaseException) -> bool:
+        """
+        True when ``error`` is a Playwright timeout that fired because the
+        budget ran out (timeouts are capped to it). The card is then
+        flagged as partial and the collector returns what it has.
+        """
+        if isinstance(error, PlaywrightTimeoutError) and self.deadline.expired(slack=0.5):
+            self.partial = True
+            return True
+        return False
+
+    def open_side_page(self, page: Page) -> Page:
+        """
+        Opens a second tab in the same browser context, so it shares the
+        cookies and storage of the authenticated page.
+        """
+        return page.context.new_page()
+
+    def stream_interleaved(self, page: Page, collectors, wait_ms: int = 0):
+        """
+        Drives several list collectors side by side.
+
+        Each collector is a generator that yields once per round, right after
+        it has triggered a scroll or navigation, and returns its result list.
+        All collectors are stepped before the shared wait, so the waits of
+        the different lists overlap instead of adding up.
+
+        Names passed to emit() during a step are yielded as ConnectionBatch
+        objects straight away. The collector results are the return value.
+        """
+        results = [None] * len(collectors)
+        pending = dict(enumerate(collectors))
+
+        while pending:
+            for index, collector in list(pending.items()):
+                try:
+                    next(collector)
+                except StopIteration as done:
+                    results[index] = done.value
+                    del pending[index]
+
+                emitted, self._outbox = self._outbox, []
+                for label, usernames in emitted:
+                    yield self.batch(label, usernames)
+
+            if self.round_hook is not None:
+                self.round_hook(page)
+
+            if pending and wait_ms:
+                page.wait_for_timeout(self.deadline.timeout_ms(wait_ms))
+
+        return results
+
+    def run_interleaved(self, page: Page, collectors, wait_ms: int = 0) -> list:
+        stream = self.stream_interleaved(page, collectors, wait_ms)
+        while True:
+            try:
+                next(stream)
+            except StopIteration as done:
+                return done.value
+
+    def checkpoint_key(self, label: str) -> str:
+        return f"{self.name}_{getattr(self, '_username', '')}_{label}"
+
+    def load_checkpoint(self, label: str) -> dict:
+        return checkpoint_store.load(self.checkpoint_key(label)) or {}
+
+    def save_checkpoint(self, label: str, items, rounds: int = 0, cursor=None, last_seen=None) -> None:
+        checkpoint_store.save(self.checkpoint_key(label), {
+            "items": list(items),
+            "rounds": rounds,
+            "cursor": cursor,
+            "last_seen": last_seen,
+        })
+
+    def clear_checkpoint(self, label: str) -> None:
+        checkpoint_store.clear(self.checkpoint_key(label))
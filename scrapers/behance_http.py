@@ -0,0 +1,150 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from deadline import Deadline
+
+
+class BehanceHttpError(Exception):
+    pass
+
+
+class BehanceHttpClient:
+    """
+    Fetches public Behance followers/following pages over a pooled HTTP
+    session and parses them with BeautifulSoup, without a browser.
+
+    Lists are read page by page through the ``page`` query parameter until
+    a page adds no new names. Raises BehanceHttpError when the response
+    carries no rows at all, which is how a client-side-rendered page shows
+    up; callers then fall back to the Playwright path.
+    """
+
+    BASE_URL = "https://www.behance.net"
+    ROW_SELECTOR = "h3.ProfileRow-displayName-ZZg a"
+    HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+        ),
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+
+    def __init__(self, pool_size: int = 10, timeout: float = 15.0, max_pages: int = 10):
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.pool_size = pool_size
+
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+        self.session.mount("https://", adapter)
+
+    @classmethod
+    def parse_names(cls, html: str) -> List[str]:
+        soup = BeautifulSoup(html, "html.parser")
+        names = (a.get_text(strip=True) for a in soup.select(cls.ROW_SELECTOR))
+        return [n for n in names if n]
+
+    def fetch_names(self, username: str, relation: str, max_items: int = 10,
+                    deadline: Optional[Deadline] = None) -> List[str]:
+        """
+        With a deadline, request timeouts are capped to the time left and
+        the names fetched so far are returned once it runs out.
+        """
+        url = f"{self.BASE_URL}/{username}/{relation}"
+        collected: List[str] = []
+        seen = set()
+
+        for page_number in range(1, self.max_pages + 1):
+            if deadline is not None and deadline.expired():
+                break
+
+            params = {"page": page_number} if page_number > 1 else None
+            timeout = self.timeout if deadline is None else deadline.timeout_ms(self.timeout * 1000) / 1000
+            try:
+                response = self.session.get(url, params=params, timeout=timeout)
+                response.raise_for_status()
+            except requests.RequestException:
+                if deadline is not None and deadline.expired(slack=0.5):
+                    break
+                raise
+
+            names = self.parse_names(response.text)
+            if page_number == 1 and not names:
+                raise BehanceHttpError(f"No {relation} rows in HTML for {username}")
+
+            added = 0
+            for n in names:
+                if n not in seen:
+                    seen.add(n)
+                    collected.append(n)
+                    added += 1
+                if len(collected) >= max_items:
+                    return collected
+
+            if added == 0:
+                break
+
+        return collected
+
+    def fetch_lists(self, username: str, max_items: int = 10,
+                    deadline: Optional[Deadline] = None) -> Tuple[List[str], List[str]]:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            followers = pool.submit(self.fetch_names, username, "followers", max_items, deadline)
+            following = pool.submit(self.fetch_names, username, "following", max_items, deadline)
+            return followers.result(), following.result()
+
+    def fetch_profiles(self, usernames: Iterable[str], max_items: int = 10, max_workers: int = 4,
+                       deadline: Optional[Deadline] = None) -> Dict[str, Tuple[List[str], List[str]]]:
+        """
+        Fetches several profiles concurrently. Profiles that fail are left
+        out of the result so the caller can retry them in the browser.
+        """
+        usernames = list(usernames)
+        results: Dict[str, Tuple[List[str], List[str]]] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {u: pool.submit(self.fetch_lists, u, max_items, deadline) for u in usernames}
+            for username, future in futures.items():
+                try:
+                    results[username] = future.result()
+                except (requests.RequestException, BehanceHttpError) as e:
+                    print(f"[Behance] HTTP fetch failed for {username}: {e}")
+
+        return results
+
+
+def prefetch_profiles(scrapers, max_workers: int = 4, budget: Optional[float] = None) -> None:
+    """
+    Fetches every HTTP-engine Behance scraper in one concurrent batch, so
+    their parse_page calls only have to build cards. With a budget, lists
+    cut short by it are kept and flagged as partial.
+    """
+    targets = [s for s in scrapers if getattr(s, "engine", None) == "http"]
+    if not targets:
+        return
+
+    deadline = Deadline(budget)
+    client = BehanceHttpClient(pool_size=max(2 * max_workers, 2))
+    fetched = client.fetch_profiles(
+        (s._username for s in targets),
+        max_items=max(s.max_items for s in targets),
+        max_workers=max_workers,
+        deadline=deadline,
+    )
+
+    for scraper in targets:
+        lists = fetched.get(scraper._username)
+        scraper.prefetch_failed = lists is None
+        if lists is not None:
+            followers, following = lists
+            scraper.prefetched = (followers[:scraper.max_items], following[:scraper.max_items])
+            scraper.prefetched_partial = deadline.expired()
@@ -1,15 +1,24 @@
-import time
 from playwright.sync_api import Page
+from requests import RequestException
 from scrapers.base_scraper import BaseScraper
+from scrapers.behance_http import BehanceHttpClient, BehanceHttpError
 from models import social_model
-from cross_platform_mapping import cross_platform_mapper
 
 
 class BehanceScraper(BaseScraper):
 
-    def __init__(self, username: str):
+    def __init__(self, username: str, engine: str = "http", max_items: int = 10):
         super().__init__()
         self._username = username
+        self.engine = engine
+        self.max_items = max_items
+        self.prefetched = None
+        self.prefetched_partial = False
+        self.prefetch_failed = False
+
+    @property
+    def browserless(self) -> bool:
+        return self.engine == "http"
 
     @property
     def base_url(self) -> str:
@@ -35,74 +44,133 @@ class BehanceScraper(BaseScraper):
         """
         Shared logic for collecting followers/following list.
         Strictly enforces max_items limit.
+        Yields after each scroll; the caller owns the wait between rounds.
         """
-        page.goto(url)
-        page.wait_for_selector('div.ScrollableModal-content-SvL', timeout=30000)
+        scroll_target = 'div.ScrollableModal-scrollableTarget-IZX'
 
-        collected = set()
+        checkpoint = self.load_checkpoint(label)
+        collected = set(checkpoint.get("items", []))
+        rounds = checkpoint.get("rounds", 0)
+        last_seen = checkpoint.get("last_seen")
         no_progress_rounds = 0
         max_no_progress = 8
+        timed_out = False
 
         print(f"[{self.name}] Collecting {label} (max {max_items})...")
 
-        while len(collected) < max_items and no_progress_rounds < max_no_progress:
+        try:
+            page.goto(url, timeout=self.deadline.timeout_ms(30000))
+            page.wait_for_selector('div.ScrollableModal-content-SvL', timeout=self.deadline.timeout_ms(30000))
+
+            # Skip past the rows already collected before the interruption.
+            for _ in range(rounds):
+                if self.out_of_time():
+                    break
+                self.scroll_container(page, scroll_target, 3)
+                page.wait_for_timeout(self.deadline.timeout_ms(500))
+
+            while len(collected) < max_items and no_progress_rounds < max_no_progress:
+
+                if self.out_of_time():
+                    timed_out = True
+                    break
+
+                rows = self.extract_rows(page, 'h3.ProfileRow-displayName-ZZg a', [("", "text")])
+                names = [name for name, in rows if name]
 
-            names = page.evaluate('''
-                () => Array.from(document.querySelectorAll('h3.ProfileRow-displayName-ZZg a'))
-                           .map(a => a.innerText.trim())
-                           .filter(Boolean)
-            ''')
+                added = []
+                for n in names:
+                    if len(collected) >= max_items:
+                        break
+
+                    if n not in collected:
+                        collected.add(n)
+                        last_seen = n
+                        added.append(n)
+                        print(f"  → + {n} ({len(collected)}/{max_items})")
+
+                self.emit(label, added)
 
-            added = 0
-            for n in names:
                 if len(collected) >= max_items:
                     break
 
-                if n not in collected:
-                    collected.add(n)
-                    added += 1
-                    print(f"  → + {n} ({len(collected)}/{max_items})")
+                if not added:
+                    no_progress_rounds += 1
+                else:
+                    no_progress_rounds = 0
 
-            if len(collected) >= max_items:
-                break
+                self.scroll_container(page, scroll_target, 3)
+                rounds += 1
 
-            if added == 0:
-                no_progress_rounds += 1
-            else:
-                no_progress_rounds = 0
+                if rounds % self.checkpoint_every == 0:
+                    self.save_checkpoint(label, collected, rounds=rounds, last_seen=last_seen)
 
-            page.evaluate('''
-                const modal = document.querySelector('div.ScrollableModal-scrollableTarget-IZX');
-                if (modal) modal.scrollBy(0, modal.clientHeight * 3);
-            ''')
+                yield
+        except Exception as e:
+            if not self.budget_exceeded(e):
+                self.save_checkpoint(label, collected, rounds=rounds, last_seen=last_seen)
+                raise
+            timed_out = True
 
-            time.sleep(2.5)
+        if timed_out:
+            self.save_checkpoint(label, collected, rounds=rounds, last_seen=last_seen)
+        else:
+            self.clear_checkpoint(label)
 
         result = list(collected)[:max_items]
-        print(f"[{self.name}] Collected {len(result)} {label}")
+        print(f"[{self.name}] Collected {len(result)} {label}{' (time budget reached)' if timed_out else ''}")
         return result
 
-    def parse_page(self, page: Page):
-
-        followers = self._collect_names(
-            page,
-            url=self.follower_url,
-            label="followers",
-            max_items=10
-        )
-
-        following = self._collect_names(
-            page,
-            url=self.following_url,
-            label="following",
-            max_items=10
-        )
+    def _fetch_http(self):
+        if self.prefetched is not None:
+            self.partial = self.partial or self.prefetched_partial
+            return self.prefetched
+        if self.prefetch_failed:
+            # prefetch_profiles already tried (with retries); go straight to the browser.
+            return None
+
+        try:
+            lists = BehanceHttpClient().fetch_lists(self._username, max_items=self.max_items, deadline=self.deadline)
+        except (RequestException, BehanceHttpError) as e:
+            if self.out_of_time():
+                return [], []
+            print(f"[{self.name}] HTTP engine failed ({e}), falling back to browser")
+            return None
+
+        self.out_of_time()
+        return lists
+
+    def _stream_browser(self, page: Page):
+        side = self.open_side_page(page)
+        try:
+            return (yield from self.stream_interleaved(
+                page,
+                [
+                    self._collect_names(page, url=self.follower_url, label="followers", max_items=self.max_items),
+                    self._collect_names(side, url=self.following_url, label="following", max_items=self.max_items),
+                ],
+                wait_ms=2500,
+            ))
+        finally:
+            side.close()
+
+    def stream_page(self, page: Page):
+
+        lists = self._fetch_http() if self.engine == "http" else None
+        if lists is not None:
+            followers, following = lists
+            yield self.batch("followers", followers)
+            yield self.batch("following", following)
+        else:
+            followers, following = yield from self._stream_browser(page)
 
         mutual_usernames = list(set(followers) & set(following))
+        yield self.batch("mutual", mutual_usernames)
 
         print(f"[{self.name}] Mutual connections: {mutual_usernames}")
 
         card = social_model(
+            m_username=self._username,
             m_weblink=[self.follower_url, self.following_url],
             m_content=(
                 f"Followers of {self._username}: {', '.join(followers)} | "
@@ -115,10 +183,9 @@ class BehanceScraper(BaseScraper):
 
             m_followers=followers,
             m_following=following,
-            m_mutual_usernames=mutual_usernames
+            m_mutual_usernames=mutual_usernames,
+            m_partial=self.partial
         )
 
         print(card)
-        self.data.append(card.model_dump())
-
-        cross_platform_mapper.add_card(card)
\ No newline at end of file
+        return self.publish(card)
\ No newline at end of file
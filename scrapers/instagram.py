@@ -1,7 +1,6 @@
 from playwright.sync_api import Page
 from scrapers.base_scraper import BaseScraper
 from models import social_model
-from cross_platform_mapping import cross_platform_mapper
 
 
 class instagram(BaseScraper):
@@ -24,94 +23,119 @@ class instagram(BaseScraper):
     def name(self) -> str:
         return "Instagram"
 
-    def parse_page(self, page: Page):
-
-        page.wait_for_selector("header")
-
-        loc = page.locator("header h2, header span._ap3a")
-        username = loc.first.inner_text() if loc.count() > 0 else ""
+    def _collect_dialog(self, page: Page, relation: str, max_items=100):
+        """
+        Scrolls the followers/following dialog one round per step.
+        Yields after each scroll; the caller owns the wait between rounds.
+        """
+        checkpoint = self.load_checkpoint(relation)
+        collected = set(checkpoint.get("items", []))
+        rounds = checkpoint.get("rounds", 0)
+        last_seen = checkpoint.get("last_seen")
+        prev_count = len(collected)
+        resumed = rounds > 0
+        timed_out = False
+
+        try:
+            page.click(f"a[href$='/{relation}/']", timeout=self.deadline.timeout_ms(30000))
+            page.wait_for_selector("div[role='dialog'] a.notranslate", timeout=self.deadline.timeout_ms(30000))
+
+            loc = page.locator("div[role='dialog'] a.notranslate").first
+            box = loc.bounding_box()
+            page.mouse.move(box["x"] + box["width"] + 20, box["y"] + 10)
+
+            # Skip past the rows already collected before the interruption.
+            for _ in range(rounds):
+                if self.out_of_time():
+                    break
+                page.mouse.wheel(0, 1500)
+                page.wait_for_timeout(self.deadline.timeout_ms(1000))
+
+            while len(collected) < max_items:
+                if self.out_of_time():
+                    timed_out = True
+                    break
+
+                page.mouse.wheel(0, 1500)
+                rounds += 1
+                yield
+
+                rows = self.extract_rows(page, "div[role='dialog'] a.notranslate", [("", "text")])
+                current = [name for name, in rows]
+                self.emit(relation, [u for u in dict.fromkeys(current) if u not in collected])
+                collected.update(current)
+                if current:
+                    last_seen = current[-1]
+
+                if len(collected) == prev_count:
+                    if resumed:
+                        # The quick fast-forward may not have loaded rows past
+                        # the restored ones yet, so one empty round right after
+                        # a resume does not mean the end of the list.
+                        resumed = False
+                        continue
+                    break
+
+                resumed = False
+                prev_count = len(collected)
+
+                if rounds % self.checkpoint_every == 0:
+                    self.save_checkpoint(relation, collected, rounds=rounds, last_seen=last_seen)
+        except Exception as e:
+            if not self.budget_exceeded(e):
+                self.save_checkpoint(relation, collected, rounds=rounds, last_seen=last_seen)
+                raise
+            timed_out = True
+
+        if timed_out:
+            self.save_checkpoint(relation, collected, rounds=rounds, last_seen=last_seen)
+        else:
+            self.clear_checkpoint(relation)
+
+        result = list(collected)[:max_items]
+
+        print(len(result), result)
+        return result
+
+    def stream_page(self, page: Page):
+
+        page.wait_for_selector("header", timeout=self.deadline.timeout_ms(30000))
+
+        # The whole header in one round trip.
+        row, = self.extract_rows(page, "body", [
+            ("header h2, header span._ap3a", "text"),
+            ("header section h1, header section span[dir='auto']", "text"),
+            ("header section span span span", "text"),
+            ("a[href$='/followers/'] span", "text", 1),
+            ("a[href$='/following/'] span", "text", 1),
+            ("header section span._ap3a._aaco._aacu._aacx._aad7._aade", "text"),
+        ])
+        username, real_name, total_posts, followers, following, bio_text = (value or "" for value in row)
         print(username)
-
-        loc = page.locator("header section h1, header section span[dir='auto']")
-        real_name = loc.first.inner_text() if loc.count() > 0 else ""
         print(real_name)
-
-        posts = page.locator("header section span span span").first
-        total_posts = posts.inner_text() if posts.count() > 0 else ""
         print(total_posts)
-
-        loc = page.locator("a[href$='/followers/'] span")
-        followers = loc.nth(1).inner_text() if loc.count() > 1 else ""
         print(followers)
-
-        loc = page.locator("a[href$='/following/'] span")
-        following = loc.nth(1).inner_text() if loc.count() > 1 else ""
         print(following)
-
-        bio = page.locator("header section span._ap3a._aaco._aacu._aacx._aad7._aade").first
-        bio_text = bio.inner_text() if bio.count() > 0 else ""
         print("bio:", bio_text)
 
-        page.click("a[href$='/following/']")
-        MAX_FOLLOWING = 100
-
-        page.wait_for_selector("div[role='dialog'] a.notranslate")
-
-        loc = page.locator("div[role='dialog'] a.notranslate").first
-        box = loc.bounding_box()
-        page.mouse.move(box["x"] + box["width"] + 20, box["y"] + 10)
-
-        following_user = set()
-        prev_count = 0
-
-        while len(following_user) < MAX_FOLLOWING:
-            page.mouse.wheel(0, 1500)
-            page.wait_for_timeout(4000)
-
-            loc = page.locator("div[role='dialog'] a.notranslate")
-            current = loc.all_inner_texts()
-            following_user.update(current)
-
-            if len(following_user) == prev_count:
-                break
-
-            prev_count = len(following_user)
-
-        following_user = list(following_user)[:MAX_FOLLOWING]
-
-        print(len(following_user), following_user)
-
-        page.goto(self.seed_url)
-        page.click("a[href$='/followers/']")
-        max_followers = 100
-
-        page.wait_for_selector("div[role='dialog'] a.notranslate")
-
-        loc = page.locator("div[role='dialog'] a.notranslate").first
-        box = loc.bounding_box()
-        page.mouse.move(box["x"] + box["width"] + 20, box["y"] + 10)
-
-        followers_user = set()
-        prev_count = 0
-
-        while len(followers_user) < max_followers:
-            page.mouse.wheel(0, 1500)
-            page.wait_for_timeout(4000)
-
-            loc = page.locator("div[role='dialog'] a.notranslate")
-            current = loc.all_inner_texts()
-            followers_user.update(current)
-
-            if len(followers_user) == prev_count:
-                break
-
-            prev_count = len(followers_user)
-
-        followers_user = list(followers_user)[:max_followers]
-
-        print(len(followers_user), followers_user)
+        side = self.open_side_page(page)
+        try:
+            side.goto(self.seed_url, timeout=self.deadline.timeout_ms(30000))
+            side.wait_for_selector("header", timeout=self.deadline.timeout_ms(30000))
+
+            following_user, followers_user = yield from self.stream_interleaved(
+                page,
+                [
+                    self._collect_dialog(page, "following", max_items=100),
+                    self._collect_dialog(side, "followers", max_items=100),
+                ],
+                wait_ms=4000,
+            )
+        finally:
+            side.close()
 
         mutual = list(set(followers_user) & set(following_user))
+        yield self.batch("mutual", mutual)
         
         card = social_model(
             m_username=username,
@@ -126,11 +150,9 @@ class instagram(BaseScraper):
             m_platform="instagram",
             m_followers=followers_user,
             m_following=following_user,
-            m_mutual_usernames=mutual
+            m_mutual_usernames=mutual,
+            m_partial=self.partial
         )
 
         print(card)
-        self.data.append(card.model_dump())
-        
-        cross_platform_mapper.add_card(card)
-
+        return self.publish(card)
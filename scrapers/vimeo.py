@@ -1,7 +1,6 @@
 from playwright.sync_api import Page
 from scrapers.base_scraper import BaseScraper
 from models import social_model
-from cross_platform_mapping import cross_platform_mapper
 
 
 class vimeo(BaseScraper):
@@ -24,88 +23,112 @@ class vimeo(BaseScraper):
     def name(self) -> str:
         return "Vimeo"
 
-    def parse_page(self, page: Page):
-
+    def _collect_pages(self, page: Page, url: str, label: str, max_pages=19):
+        """
+        Walks a paginated followers/following list one page per step.
+        The next page is requested without blocking and awaited only after
+        the caller has stepped the other collectors, so page loads overlap.
+        """
         base_url = "https://www.vimeo.com"
-        username = page.locator("div.sc-aa85dd4c-2 span div.sc-aa85dd4c-7").first.inner_text().strip()
-        print(f"{username}: {page.url}")
 
-        followers_anchor = page.locator("a[href*='following/followers']")
+        checkpoint = self.load_checkpoint(label)
+        collected = checkpoint.get("items", [])
+        start_page = checkpoint.get("rounds", 0) + 1
+        cursor = checkpoint.get("cursor") or url
 
-        followers_text = followers_anchor.inner_text().strip()
-        followers_link = followers_anchor.get_attribute("href")
-        print(f"{followers_text}: {followers_link}")
+        timed_out = False
 
-        following_anchor = page.locator("a[href$='/following']")
+        try:
+            page.goto(cursor, timeout=self.deadline.timeout_ms(30000))
 
-        following_text = following_anchor.inner_text().strip()
-        following_link = following_anchor.get_attribute("href")
-        print(f"{following_text}: {following_link}")
+            for page_number in range(start_page, max_pages + 1):
 
-        followers_url = followers_link
-        following_url = following_link
+                rows = self.extract_rows(page, "div.data", [("p.title", "text")])
+                page_titles = [title or "" for title, in rows]
 
-        page.goto(followers_url)
+                collected.extend(page_titles)
+                self.emit(label, page_titles)
 
-        followers_data = []
+                next_links = self.extract_rows(page, "li.pagination_next a", [("", "@href")])
 
-        for page_number in range(1, 20):
-
-            blocks = page.query_selector_all("div.data")
-
-            for b in blocks:
-                title_el = b.query_selector("p.title")
-                title = title_el.inner_text().strip() if title_el else ""
-
-                followers_data.append(title)
-
-            next_btn = page.query_selector("li.pagination_next a")
+                if not next_links:
+                    break
 
-            if next_btn:
-                next_href = next_btn.get_attribute("href")
+                next_href, = next_links[0]
                 if not next_href:
                     break
 
                 next_page_url = base_url + next_href
-                page.goto(next_page_url)
+                self.save_checkpoint(
+                    label, collected, rounds=page_number, cursor=next_page_url,
+                    last_seen=collected[-1] if collected else None
+                )
 
-            else:
-                break
+                if self.out_of_time():
+                    timed_out = True
+                    break
 
-        print(followers_data)
+                current_url = page.url
+                page.evaluate("url => { window.location.href = url; }", next_page_url)
 
-        page.goto(following_url)
+                yield
 
-        following_data = []
+                # Wait for the navigation itself, not an exact URL: vimeo.com
+                # redirects between hosts, like page.goto() would follow.
+                page.wait_for_url(lambda u: u != current_url, timeout=self.deadline.timeout_ms(30000))
+        except Exception as e:
+            if not self.budget_exceeded(e):
+                print(f"[{self.name}] {label} interrupted, checkpoint kept at {len(collected)} items")
+                raise
+            timed_out = True
 
-        for page_number in range(1, 20):
+        if not timed_out:
+            self.clear_checkpoint(label)
 
-            blocks = page.query_selector_all("div.data")
+        return collected
 
-            for b in blocks:
-                title_el = b.query_selector("p.title")
-                title = title_el.inner_text().strip() if title_el else ""
+    def stream_page(self, page: Page):
 
-                following_data.append(title)
+        username = page.locator("div.sc-aa85dd4c-2 span div.sc-aa85dd4c-7").first.inner_text(
+            timeout=self.deadline.timeout_ms(30000)
+        ).strip()
+        print(f"{username}: {page.url}")
 
-            next_btn = page.query_selector("li.pagination_next a")
+        followers_anchor = page.locator("a[href*='following/followers']")
 
-            if next_btn:
-                next_href = next_btn.get_attribute("href")
-                if not next_href:
-                    break
+        followers_text = followers_anchor.inner_text(timeout=self.deadline.timeout_ms(30000)).strip()
+        followers_link = followers_anchor.get_attribute("href", timeout=self.deadline.timeout_ms(30000))
+        print(f"{followers_text}: {followers_link}")
 
-                next_page_url = base_url + next_href
-                page.goto(next_page_url)
+        following_anchor = page.locator("a[href$='/following']")
 
-            else:
-                break
+        following_text = following_anchor.inner_text(timeout=self.deadline.timeout_ms(30000)).strip()
+        following_link = following_anchor.get_attribute("href", timeout=self.deadline.timeout_ms(30000))
+        print(f"{following_text}: {following_link}")
+
+        followers_url = followers_link
+        following_url = following_link
 
+        side = self.open_side_page(page)
+        try:
+            followers_data, following_data = yield from self.stream_interleaved(
+                page,
+                [
+                    self._collect_pages(page, followers_url, label="followers"),
+                    self._collect_pages(side, following_url, label="following"),
+                ],
+            )
+        finally:
+            side.close()
+
+        print(followers_data)
         print(following_data)
 
         mutual = list(set(followers_data) & set(following_data))
+        yield self.batch("mutual", mutual)
         
         card = social_model(
+            m_username=self._username,
             m_weblink=[followers_url, following_url],
             m_content=f"Followers: {followers_data}\nFollowing: {following_data}\nMutual: {mutual}",
             m_content_type=["vimeo_followers", "vimeo_following", "vimeo_mutual"],
@@ -113,10 +136,9 @@ class vimeo(BaseScraper):
             m_platform="vimeo",
             m_followers=followers_data,
             m_following=following_data,
-            m_mutual_usernames=mutual
+            m_mutual_usernames=mutual,
+            m_partial=self.partial
         )
 
         print(card)
-        self.data.append(card.model_dump())
-        
-        cross_platform_mapper.add_card(card)
+        return self.publish(card)
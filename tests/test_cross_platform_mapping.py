@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from cross_platform_mapping import CrossPlatformMapper
+from models import social_model
+
+
+@pytest.fixture
+def mapper():
+    mapper = CrossPlatformMapper()
+    mapper.clear_cards()
+    mapper.add_card(social_model(
+        m_platform="instagram", m_username="a",
+        m_following=["JohnDoe", "anna_k", "mark.twain", "zed"],
+    ))
+    mapper.add_card(social_model(
+        m_platform="behance", m_username="b",
+        m_following=["johndoe", "johndoe1", "anna_k", "marc.twain", "unrelated_user"],
+    ))
+    yield mapper
+    mapper.clear_cards()
+
+
+def pairs(comparisons):
+    return sorted((s.username_a, s.username_b) for c in comparisons for s in c.similar)
+
+
+def test_lsh_and_exhaustive_comparison_return_the_same_pairs(mapper):
+    exhaustive = pairs(mapper.compare_following_across_platforms(matcher="exhaustive"))
+    lsh = pairs(mapper.compare_following_across_platforms(matcher="lsh"))
+
+    assert ("JohnDoe", "johndoe") in exhaustive
+    assert ("JohnDoe", "johndoe1") in exhaustive
+    assert lsh == exhaustive
@@ -0,0 +1,27 @@
+import pytest
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from edge_exporter import export_edges
+from models import social_model
+
+
+def make_cards():
+    return [
+        social_model(m_platform="instagram", m_username="a",
+                     m_followers=["x", "y", "z"], m_following=["x"]),
+        social_model(m_platform="behance", m_username="b",
+                     m_followers=["p"], m_following=["q"], m_mutual_usernames=["r"]),
+    ]
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 100])
+def test_batches_smaller_than_edge_count_keep_every_row(tmp_path, batch_size):
+    path = str(tmp_path / "edges.parquet")
+
+    written = export_edges(make_cards(), path, batch_size=batch_size)
+
+    table = pq.read_table(path)
+    assert written == 7
+    assert table.num_rows == 7
+    assert sorted(table.column("target").to_pylist()) == ["p", "q", "r", "x", "x", "y", "z"]
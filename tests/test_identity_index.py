@@ -0,0 +1,50 @@
+import random
+import string
+
+import pytest
+
+pytest.importorskip("rapidfuzz")
+pytest.importorskip("numpy")
+
+from identity_index import IdentityIndex
+
+ALPHABET = string.ascii_lowercase + "_0123456789"
+
+
+def one_edit(rng, name):
+    i = rng.randrange(len(name))
+    c = rng.choice(ALPHABET)
+    return rng.choice([
+        name[:i] + c + name[i + 1:],
+        name[:i] + c + name[i:],
+        name[:i] + name[i + 1:],
+    ])
+
+
+@pytest.fixture
+def planted():
+    """300 random names on one platform, each with a one-edit variant on another."""
+    rng = random.Random(0)
+    index = IdentityIndex()
+    pairs = []
+    for _ in range(300):
+        name = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(5, 12)))
+        pairs.append((index.add(name, "instagram"), index.add(one_edit(rng, name), "behance")))
+    return index, pairs
+
+
+def test_evaluate_recall_floor(planted):
+    index, _ = planted
+    report = index.evaluate(threshold=70)
+
+    assert report["exhaustive_matches"] >= 300
+    assert report["recall"] >= 0.95
+    assert report["candidate_precision"] >= 0.9
+    assert report["comparisons_saved"] > 0.99
+
+
+def test_one_edit_variants_are_always_candidates(planted):
+    index, pairs = planted
+    candidates = index.candidate_pairs()
+
+    assert all((min(pair), max(pair)) in candidates for pair in pairs)
@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+from identity_store import IdentityStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    with IdentityStore(str(tmp_path / "identities.sqlite")) as store:
+        yield store
+
+
+def test_same_platform_names_are_kept_apart(store):
+    ids = [store.resolve("instagram", name) for name in ("john_smith", "john_smith2", "jon_smith", "anna", "anne")]
+    assert len(set(ids)) == 5
+
+
+def test_other_platforms_join_the_matching_identity(store):
+    john = store.resolve("instagram", "john_smith")
+    anna = store.resolve("instagram", "anna")
+
+    assert store.resolve("behance", "john_smith_") == john
+    assert store.resolve("behance", "Anna") == anna
+    assert store.resolve("instagram", "JOHN_SMITH") == john
+    assert store.stats() == {"identities": 2, "aliases": 4}
+
+
+def new_identity(store, platform, username):
+    # Bypasses resolve() so the fixture is not merged while it is built.
+    identity = store.conn.execute(
+        "INSERT INTO identities (canonical, created_at) VALUES (?, 0)", (username,)
+    ).lastrowid
+    store._add_alias(identity, platform, username, username, 0.0)
+    return identity
+
+
+def test_taken_identities_do_not_crowd_out_the_match(tmp_path):
+    with IdentityStore(str(tmp_path / "identities.sqlite"), max_candidates=5) as store:
+        # Many close names on identities that already have a twitter alias...
+        for i in range(20):
+            new_identity(store, "twitter", f"john_smith_art_{chr(97 + i)}")
+        # ...and one behance-only identity that matches less closely.
+        target = new_identity(store, "behance", "john_smith_arts")
+
+        found = [identity for identity, _, _ in store.candidates("john_smith_art_", platform="twitter")]
+
+    assert found and found[0] == target
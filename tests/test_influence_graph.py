@@ -0,0 +1,58 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from cross_platform_mapping import CrossPlatformMapper
+from influence_graph import InfluenceGraph
+from models import social_model
+
+
+def make_cards():
+    return [
+        social_model(m_platform="instagram", m_username="alice",
+                     m_followers=["Bob", "carol", "dave"], m_following=["bob", "erin"],
+                     m_mutual_usernames=["bob"]),
+        social_model(m_platform="behance", m_username="zoe",
+                     m_followers=["carol", "frank"], m_following=["dave"]),
+        social_model(m_platform="vimeo", m_username="yann",
+                     m_followers=["erin"], m_mutual_usernames=["carol"]),
+    ]
+
+
+def test_cards_can_be_added_after_scoring():
+    first, second, third = make_cards()
+    graph = InfluenceGraph()
+
+    graph.add_card(first)
+    before = graph.pagerank()
+    graph.add_card(second)
+    graph.in_degree()
+    graph.add_card(third)
+    after = graph.pagerank()
+
+    assert len(after) == graph.num_nodes > len(before)
+    assert after.sum() == pytest.approx(1.0)
+
+
+def test_each_follow_counts_once():
+    graph = InfluenceGraph.from_cards(make_cards()[:1])
+    assert graph.adjacency().max() == 1.0
+
+
+def test_legacy_scoring_matches_fuzzy_at_threshold_100():
+    mapper = CrossPlatformMapper()
+    mapper.clear_cards()
+    for card in make_cards():
+        mapper.add_card(card)
+
+    def scores(result):
+        return {user.names[0].lower(): user.score for user in result.top(100)}
+
+    fuzzy = scores(mapper.analyze_cross_platform_influence(threshold=100, scoring="fuzzy"))
+    legacy = scores(mapper.analyze_cross_platform_influence(threshold=100, scoring="legacy"))
+    mapper.clear_cards()
+
+    assert legacy.keys() == fuzzy.keys()
+    for name, score in fuzzy.items():
+        assert legacy[name] == pytest.approx(score)
@@ -0,0 +1,61 @@
+import pytest
+
+from models import parse_count, social_model
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1.2M", 1_200_000),
+    ("12,345", 12_345),
+    ("1.234", 1_234),
+    ("1 234 567", 1_234_567),
+    ("1.234.567,5", 1_234_568),
+    ("3,5 K", 3_500),
+    ("12.3k", 12_300),
+    ("2B", 2_000_000_000),
+    ("1,2 mil", 1_200),
+    ("1,2 mill.", 1_200_000),
+    ("12,3 тыс", 12_300),
+    ("1,2 млн", 1_200_000),
+    ("1.2万", 12_000),
+    ("987 followers", 987),
+    ("1,234 fans", 1_234),
+    ("Posts 42", 42),
+    ("1.15K", 1_150),
+])
+def test_parse_count(text, expected):
+    assert parse_count(text) == expected
+
+
+@pytest.mark.parametrize("text", ["1,2 xyz", "12 xyz.", "", "abc", None])
+def test_parse_count_rejects_unknown_or_missing_numbers(text):
+    assert parse_count(text) is None
+
+
+@pytest.mark.parametrize("text, expected", [("2,5", 3), ("5.5", 6), ("0.5", 1), (2.5, 3), (7, 7)])
+def test_parse_count_rounds_halves_up(text, expected):
+    assert parse_count(text) == expected
+
+
+def test_counts_are_parsed_on_validation():
+    card = social_model(m_platform="instagram", m_total_followers="1.2M", m_total_posts="1,024")
+    assert card.m_total_followers_n == 1_200_000
+    assert card.m_total_posts_n == 1_024
+    assert card.m_total_following_n is None
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_bulk_round_trip(validate):
+    rows = [
+        {"m_platform": "instagram", "m_username": "a", "m_total_followers": "3.4K", "m_followers": ["x"]},
+        {"m_platform": "behance", "m_username": "b", "m_likes": "12,345"},
+    ]
+
+    cards = social_model.bulk(rows, validate=validate)
+
+    assert [card.m_total_followers_n for card in cards] == [3_400, None]
+    assert cards[1].m_likes_n == 12_345
+    assert cards[1].m_weblink == []
+    assert cards[0].m_crawled_at is not None
+
+    again = social_model.bulk([card.model_dump(exclude_none=True) for card in cards], validate=validate)
+    assert [card.model_dump() for card in again] == [card.model_dump() for card in cards]
@@ -0,0 +1,67 @@
+import gzip
+import os
+import time
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from login_session.session_pool import NoSessionAvailable, SessionPool, failure_outcome
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pool = SessionPool("instagram", directory=str(tmp_path / "sessions"), cooldown=60, max_failures=2)
+    for account in ("alice", "bob"):
+        with gzip.open(pool.add_account_path(account), "wt", encoding="utf-8") as f:
+            f.write("{}")
+    return pool
+
+
+def test_throttled_account_cools_down(pool):
+    with pool.lease() as lease:
+        throttled = lease.account
+        lease.mark("throttled")
+
+    with pool.lease() as lease:
+        assert lease.account != throttled
+        with pytest.raises(NoSessionAvailable):
+            pool.lease(timeout=0.1)
+
+
+def test_repeated_failures_trigger_a_cooldown(pool):
+    pool._health("bob")["last_used"] = time.time() + 3600  # alice is leased first
+
+    for _ in range(2):
+        with pool.lease() as lease:
+            assert lease.account == "alice"
+            lease.mark("failed")
+        pool._health("bob")["last_used"] = time.time() + 3600
+
+    assert pool._health("alice")["cooldown_until"] > time.time()
+    with pool.lease() as lease:
+        assert lease.account == "bob"
+
+
+def test_expired_account_without_refresher_retires(pool):
+    with pool.lease() as lease:
+        expired = lease.account
+        lease.mark("expired")
+
+    assert expired not in pool.accounts()
+    reopened = SessionPool("instagram", directory=os.path.dirname(pool.directory))
+    assert expired not in reopened.accounts()
+
+
+def test_exception_inside_lease_counts_as_failure(pool):
+    with pytest.raises(RuntimeError):
+        with pool.lease() as lease:
+            raise RuntimeError("boom")
+    assert pool._health(lease.account)["failures"] == 1
+
+
+def test_failure_outcome_classifies_errors():
+    assert failure_outcome(Exception("x"), "https://www.instagram.com/accounts/login/") == "expired"
+    assert failure_outcome(Exception("HTTP 429 Too Many Requests"), "https://x") == "throttled"
+    assert failure_outcome(TimeoutError("Timeout 30000ms exceeded"), "https://x") == "failed"